@@ -8,12 +8,28 @@ so callers can safely aggregate results.
 """
 
 import logging
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 
 import asyncpg
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Memo for find_same_event_markets: pool -> (version, groups).  The version
+# is ``(max(updated_at), count(*))`` over the eligible markets, so any
+# upsert, insert, or status change invalidates the cached grouping.
+# asyncpg pools can't be weakly referenced, so entries for closed pools are
+# evicted on the next call instead; callers always get copies of the groups.
+_same_event_cache: dict[asyncpg.Pool, tuple[tuple, list["MarketGroup"]]] = {}
+
+_SAME_EVENT_FILTER = """
+    active = true
+    AND closed = false
+    AND slug IS NOT NULL
+    AND array_length(clob_token_ids, 1) > 0
+"""
+
 
 @dataclass
 class MarketGroup:
@@ -60,6 +76,18 @@ class Mispricing:
     overpriced_token_ids: list[str] = field(default_factory=list)
 
 
+def _copy_groups(groups: list[MarketGroup]) -> list[MarketGroup]:
+    """Copy cached groups so callers can't mutate the memoized lists."""
+    return [
+        MarketGroup(
+            slug_prefix=g.slug_prefix,
+            condition_ids=list(g.condition_ids),
+            token_ids=list(g.token_ids),
+        )
+        for g in groups
+    ]
+
+
 async def find_same_event_markets(
     pool: asyncpg.Pool,
 ) -> list[MarketGroup]:
@@ -70,9 +98,14 @@ async def find_same_event_markets(
     on individual market slugs, or markets are directly grouped by
     ``event_slug`` if stored).
 
-    This implementation groups markets whose slugs share the same prefix
-    up to the last hyphen-number segment.  Groups with only one market are
-    excluded — they can't exhibit a sum-to-one constraint.
+    This implementation groups markets on the generated ``slug_prefix``
+    column (the slug up to the last hyphen-number segment).  Groups with
+    only one market are excluded — they can't exhibit a sum-to-one
+    constraint.
+
+    Results are memoized per pool and keyed on ``max(updated_at)`` and
+    ``count(*)`` of the eligible markets; the grouping is only recomputed
+    when that version changes.
 
     Parameters
     ----------
@@ -86,53 +119,59 @@ async def find_same_event_markets(
         Returns empty list on error or no data.
     """
     try:
-        rows = await pool.fetch(
-            """
-            SELECT condition_id, slug, clob_token_ids
+        version_row = await pool.fetchrow(
+            f"""
+            SELECT max(updated_at) AS max_updated_at, count(*) AS n
             FROM markets
-            WHERE active = true
-              AND closed = false
-              AND slug IS NOT NULL
-              AND array_length(clob_token_ids, 1) > 0
-            ORDER BY slug
+            WHERE {_SAME_EVENT_FILTER}
             """
         )
-        if not rows:
-            return []
-
-        # Group by slug prefix: strip trailing "-<digits>" suffix
-        groups: dict[str, MarketGroup] = {}
-        for row in rows:
-            slug: str = row["slug"]
-            condition_id: str = row["condition_id"]
-            token_ids: list[str] = list(row["clob_token_ids"] or [])
-
-            prefix = _slug_prefix(slug)
-            if prefix not in groups:
-                groups[prefix] = MarketGroup(slug_prefix=prefix)
-            groups[prefix].condition_ids.append(condition_id)
-            groups[prefix].token_ids.extend(token_ids)
-
-        # Return only groups with 2+ markets
-        return [g for g in groups.values() if len(g.condition_ids) >= 2]
+        version = (version_row["max_updated_at"], version_row["n"])
+        for stale in [p for p in _same_event_cache if p.is_closing()]:
+            del _same_event_cache[stale]
+        cached = _same_event_cache.get(pool)
+        if cached is not None and cached[0] == version:
+            return _copy_groups(cached[1])
+
+        # Group on the generated slug_prefix column (migration 009) so
+        # Postgres does the bucketing.  Unqualified filter columns in the
+        # token subquery resolve to m2; tokens keep slug/outcome order.
+        rows = await pool.fetch(
+            f"""
+            SELECT
+                m.slug_prefix,
+                array_agg(m.condition_id ORDER BY m.slug) AS condition_ids,
+                ARRAY(
+                    SELECT t.token_id
+                    FROM markets m2,
+                         unnest(m2.clob_token_ids)
+                             WITH ORDINALITY AS t(token_id, ord)
+                    WHERE m2.slug_prefix = m.slug_prefix
+                      AND {_SAME_EVENT_FILTER}
+                    ORDER BY m2.slug, t.ord
+                ) AS token_ids
+            FROM markets m
+            WHERE {_SAME_EVENT_FILTER}
+            GROUP BY m.slug_prefix
+            HAVING count(*) >= 2
+            ORDER BY min(m.slug)
+            """
+        )
+        result = [
+            MarketGroup(
+                slug_prefix=row["slug_prefix"],
+                condition_ids=list(row["condition_ids"]),
+                token_ids=list(row["token_ids"]),
+            )
+            for row in rows
+        ]
+        _same_event_cache[pool] = (version, result)
+        return _copy_groups(result)
     except Exception:
         logger.warning("find_same_event_markets failed", exc_info=True)
         return []
 
 
-def _slug_prefix(slug: str) -> str:
-    """Extract the event prefix from a market slug.
-
-    Strips trailing ``-<digits>`` suffix.  For example:
-    ``"us-election-2024-winner-2"``  ->  ``"us-election-2024-winner"``
-    ``"bitcoin-price-jan-2025"``     ->  ``"bitcoin-price-jan-2025"``
-    """
-    parts = slug.rsplit("-", 1)
-    if len(parts) == 2 and parts[1].isdigit():
-        return parts[0]
-    return slug
-
-
 async def compute_price_correlation(
     pool: asyncpg.Pool,
     token_id_a: str,
@@ -218,17 +257,23 @@ async def find_correlated_pairs(
     min_correlation: float = 0.7,
     lookback_hours: int = 168,
     max_tokens: int = 50,
-) -> list[tuple[str, str, float]]:
+) -> AsyncIterator[tuple[str, str, float]]:
     """Scan active markets for highly correlated token pairs.
 
     Computes pairwise Pearson correlation for active market tokens
     that have price data in the lookback window.  Only pairs meeting the
-    ``min_correlation`` threshold are returned.
+    ``min_correlation`` threshold are yielded, as soon as each is found,
+    so consumers can process pairs while the scan continues and the full
+    pair list is never materialised::
 
-    Performance: Pairwise correlation is O(n^2) in SQL queries.
-    ``max_tokens`` caps the token count to keep this tractable
-    (50 tokens = 1,225 pairs; 100 = 4,950).  Tokens are selected by
-    highest data density (most price snapshots in the window).
+        pairs = [p async for p in find_correlated_pairs(pool)]
+
+    Performance: the hourly-bucketed series for all selected tokens are
+    fetched in one query and each pair is aligned and correlated in NumPy,
+    so the O(n^2) pair loop costs no database round trips.  ``max_tokens``
+    caps the token count (50 tokens = 1,225 pairs; 100 = 4,950).  Tokens
+    are selected by highest data density (most price snapshots in the
+    window).  Results match ``compute_price_correlation`` pair-for-pair.
 
     Parameters
     ----------
@@ -242,11 +287,14 @@ async def find_correlated_pairs(
         Maximum number of tokens to scan (default 50).  Tokens with the
         most price data in the window are selected first.
 
-    Returns
-    -------
-    list[tuple[str, str, float]]
-        List of ``(token_id_a, token_id_b, correlation)`` triples,
-        ordered by |correlation| descending.  Returns empty list on error.
+    Yields
+    ------
+    tuple[str, str, float]
+        ``(token_id_a, token_id_b, correlation)`` triples in scan order
+        (token A by data density, then each later token B).  Yields
+        nothing if the token or series query fails; a pair whose
+        correlation raises is logged and skipped, so one bad series does
+        not end the scan.
     """
     try:
         # Select tokens with the most data points in the window,
@@ -273,22 +321,150 @@ async def find_correlated_pairs(
         token_ids = [row["token_id"] for row in rows]
 
         if len(token_ids) < 2:
-            return []
+            return
+
+        series = await _fetch_hourly_series(pool, token_ids, lookback_hours)
+        lookback_us = lookback_hours * 3_600_000_000
 
-        results: list[tuple[str, str, float]] = []
         for i, tok_a in enumerate(token_ids):
+            if tok_a not in series:
+                continue
             for tok_b in token_ids[i + 1 :]:
-                corr = await compute_price_correlation(
-                    pool, tok_a, tok_b, lookback_hours
-                )
+                if tok_b not in series:
+                    continue
+                try:
+                    corr = _aligned_correlation(
+                        series[tok_a], series[tok_b], lookback_us
+                    )
+                except Exception:
+                    logger.warning(
+                        "Correlation failed for %s / %s",
+                        tok_a,
+                        tok_b,
+                        exc_info=True,
+                    )
+                    continue
                 if corr is not None and abs(corr) >= min_correlation:
-                    results.append((tok_a, tok_b, corr))
-
-        results.sort(key=lambda x: abs(x[2]), reverse=True)
-        return results
+                    yield (tok_a, tok_b, corr)
     except Exception:
         logger.warning("find_correlated_pairs failed", exc_info=True)
-        return []
+
+
+@dataclass
+class _HourlySeries:
+    """Hourly-bucketed price series for one token.
+
+    Attributes
+    ----------
+    buckets:
+        Bucket start times as epoch seconds, ascending.
+    prices:
+        Last price observed in each bucket.
+    last_ts_us:
+        Epoch microseconds of the last snapshot in each bucket (ascending,
+        so the final element is the token's latest snapshot).
+    """
+
+    buckets: np.ndarray
+    prices: np.ndarray
+    last_ts_us: np.ndarray
+
+
+async def _fetch_hourly_series(
+    pool: asyncpg.Pool,
+    token_ids: list[str],
+    lookback_hours: int,
+) -> dict[str, _HourlySeries]:
+    """Fetch hourly-bucketed price series for several tokens in one query.
+
+    Each token's series covers ``lookback_hours`` back from its own latest
+    snapshot, which is a superset of any pair window (pair windows end at
+    the later of the two tokens' latest snapshots).  Postgres aggregates
+    each series into arrays of epoch numbers, so the NumPy arrays are
+    filled with ``np.fromiter`` straight from one record per token rather
+    than from per-row records and datetime objects.
+    """
+    rows = await pool.fetch(
+        """
+        WITH per_token AS (
+            SELECT token_id, MAX(ts) AS max_ts
+            FROM price_snapshots
+            WHERE token_id = ANY($1::text[])
+            GROUP BY token_id
+        ),
+        hourly AS (
+            SELECT
+                ps.token_id,
+                time_bucket('1 hour', ps.ts) AS bucket,
+                last(ps.price, ps.ts) AS price,
+                MAX(ps.ts) AS last_ts
+            FROM price_snapshots ps
+            JOIN per_token pt ON ps.token_id = pt.token_id
+            WHERE ps.token_id = ANY($1::text[])
+              AND ps.ts >= pt.max_ts - ($2 || ' hours')::interval
+            GROUP BY ps.token_id, bucket
+        )
+        SELECT
+            token_id,
+            array_agg(extract(epoch FROM bucket)::bigint ORDER BY bucket),
+            array_agg(price ORDER BY bucket),
+            array_agg(
+                (extract(epoch FROM last_ts) * 1000000)::bigint ORDER BY bucket
+            )
+        FROM hourly
+        GROUP BY token_id
+        """,
+        token_ids,
+        str(lookback_hours),
+    )
+
+    series: dict[str, _HourlySeries] = {}
+    for row in rows:
+        n = len(row[1])
+        series[row[0]] = _HourlySeries(
+            buckets=np.fromiter(row[1], dtype=np.int64, count=n),
+            prices=np.fromiter(row[2], dtype=np.float64, count=n),
+            last_ts_us=np.fromiter(row[3], dtype=np.int64, count=n),
+        )
+    return series
+
+
+def _aligned_correlation(
+    a: _HourlySeries,
+    b: _HourlySeries,
+    lookback_us: int,
+) -> float | None:
+    """Pearson correlation of two hourly series over their shared buckets.
+
+    Mirrors ``compute_price_correlation``: the window ends at the later of
+    the two latest snapshots, a bucket counts if any of its snapshots falls
+    inside the window, and the result is None for fewer than 2 aligned
+    points or a constant series.  Buckets are intersected with
+    ``np.searchsorted`` on the sorted bucket arrays.
+    """
+    cutoff = max(a.last_ts_us[-1], b.last_ts_us[-1]) - lookback_us
+    in_a = a.last_ts_us >= cutoff
+    in_b = b.last_ts_us >= cutoff
+    buckets_a, prices_a = a.buckets[in_a], a.prices[in_a]
+    buckets_b, prices_b = b.buckets[in_b], b.prices[in_b]
+    if len(buckets_a) == 0 or len(buckets_b) == 0:
+        return None
+
+    idx = np.searchsorted(buckets_b, buckets_a)
+    idx = np.minimum(idx, len(buckets_b) - 1)
+    hit = buckets_b[idx] == buckets_a
+    pa = prices_a[hit]
+    pb = prices_b[idx[hit]]
+    # A flat series has no correlation (Postgres corr() returns NULL).
+    # Check the range, not ``denom == 0``: subtracting the mean of a
+    # constant array can leave ~1e-17 residue.
+    if len(pa) < 2 or np.ptp(pa) == 0 or np.ptp(pb) == 0:
+        return None
+
+    da = pa - pa.mean()
+    db = pb - pb.mean()
+    denom = np.sqrt(np.dot(da, da) * np.dot(db, db))
+    return float(np.dot(da, db) / denom)
 
 
 async def detect_mispricing(
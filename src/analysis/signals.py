@@ -10,6 +10,7 @@ Signal types:
 - ``spread``: Bid-ask spread implies > min_edge_pct% edge
 """
 
+import heapq
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -156,7 +157,9 @@ async def generate_mean_reversion_signals(
     """
     signals: list[MarketSignal] = []
     try:
-        # Compute z-score for each token in the window in SQL.
+        # Compute z-score for each token in the window in SQL and return
+        # only tokens beyond the threshold, so the payload is one row per
+        # signal rather than one per tracked token.
         # Uses per-token MAX(ts) for lookback (not NOW()) so it works
         # on historical data and during backtesting.
         rows = await pool.fetch(
@@ -177,27 +180,28 @@ async def generate_mean_reversion_signals(
                 WHERE ps.ts >= ptl.max_ts - ($1 || ' hours')::interval
                 GROUP BY ps.token_id
                 HAVING count(*) >= 5
+            ),
+            scored AS (
+                SELECT
+                    token_id,
+                    std_price,
+                    CASE
+                        WHEN std_price > 0
+                        THEN (latest_price - mean_price) / std_price
+                        ELSE 0
+                    END AS z_score
+                FROM stats
             )
-            SELECT
-                token_id,
-                latest_price,
-                mean_price,
-                std_price,
-                CASE
-                    WHEN std_price > 0
-                    THEN (latest_price - mean_price) / std_price
-                    ELSE 0
-                END AS z_score
-            FROM stats
+            SELECT token_id, std_price, z_score
+            FROM scored
+            WHERE abs(z_score) > $2
             """,
             str(lookback_hours),
+            z_threshold,
         )
 
         for row in rows:
-            z = float(row["z_score"] or 0)
-            if abs(z) <= z_threshold:
-                continue
-
+            z = float(row["z_score"])
             token_id = row["token_id"]
             # Revert to mean: if price is high, sell; if low, buy
             direction = "sell" if z > 0 else "buy"
@@ -255,39 +259,40 @@ async def generate_spread_signals(
     """
     signals: list[MarketSignal] = []
     try:
+        # One statement: latest snapshot per token, edge filter, and the
+        # owning market, instead of a market lookup per qualifying token.
         rows = await pool.fetch(
             """
-            SELECT DISTINCT ON (token_id)
-                token_id, spread, midpoint
-            FROM orderbook_snapshots
-            WHERE spread IS NOT NULL
-              AND midpoint IS NOT NULL
-              AND midpoint > 0
-            ORDER BY token_id, ts DESC
-            """
+            WITH latest AS (
+                SELECT DISTINCT ON (token_id)
+                    token_id, spread, midpoint
+                FROM orderbook_snapshots
+                WHERE spread IS NOT NULL
+                  AND midpoint IS NOT NULL
+                  AND midpoint > 0
+                ORDER BY token_id, ts DESC
+            )
+            SELECT
+                l.token_id,
+                (l.spread / l.midpoint) * 100.0 AS edge_pct,
+                m.condition_id
+            FROM latest l
+            LEFT JOIN LATERAL (
+                SELECT condition_id
+                FROM markets
+                WHERE l.token_id = ANY(clob_token_ids)
+                LIMIT 1
+            ) m ON true
+            WHERE (l.spread / l.midpoint) * 100.0 >= $1
+            """,
+            min_edge_pct,
         )
 
         for row in rows:
-            spread = float(row["spread"])
-            midpoint = float(row["midpoint"])
-            edge_pct = (spread / midpoint) * 100.0
-
-            if edge_pct < min_edge_pct:
-                continue
-
+            edge_pct = float(row["edge_pct"])
             token_id = row["token_id"]
             strength = min((edge_pct - min_edge_pct) / min_edge_pct, 1.0)
-
-            market_row = await pool.fetchrow(
-                """
-                SELECT condition_id
-                FROM markets
-                WHERE $1 = ANY(clob_token_ids)
-                LIMIT 1
-                """,
-                token_id,
-            )
-            market_id = market_row["condition_id"] if market_row else "unknown"
+            market_id = row["condition_id"] or "unknown"
 
             signals.append(
                 MarketSignal(
@@ -304,12 +309,17 @@ async def generate_spread_signals(
     return signals
 
 
+def _strength_desc(signal: MarketSignal) -> float:
+    """Sort key ordering signals strongest first."""
+    return -signal.strength
+
+
 async def get_all_signals(pool: asyncpg.Pool) -> list[MarketSignal]:
     """Collect, deduplicate, and rank all trading signals.
 
     Runs all signal generators, deduplicates by (token_id, signal_type),
-    keeping the highest-strength signal per unique key, then sorts by
-    strength descending.
+    keeping the highest-strength signal per unique key, and ranks by
+    strength descending via a heap-merge of the per-generator lists.
 
     Parameters
     ----------
@@ -321,21 +331,28 @@ async def get_all_signals(pool: asyncpg.Pool) -> list[MarketSignal]:
     list[MarketSignal]
         All unique signals ranked by strength (strongest first).
     """
-    raw: list[MarketSignal] = []
     try:
         same_event = await generate_same_event_signals(pool)
         mean_rev = await generate_mean_reversion_signals(pool)
         spread = await generate_spread_signals(pool)
-        raw = same_event + mean_rev + spread
     except Exception:
         logger.warning("get_all_signals failed during generation", exc_info=True)
         return []
 
-    # Deduplicate: keep highest-strength per (token_id, signal_type)
-    best: dict[tuple[str, str], MarketSignal] = {}
-    for sig in raw:
+    # Merge the per-generator lists (each sorted strongest first) and
+    # deduplicate on the fly: the first signal seen for a (token_id,
+    # signal_type) key is the highest-strength one.
+    seen: set[tuple[str, str]] = set()
+    ranked: list[MarketSignal] = []
+    for sig in heapq.merge(
+        sorted(same_event, key=_strength_desc),
+        sorted(mean_rev, key=_strength_desc),
+        sorted(spread, key=_strength_desc),
+        key=_strength_desc,
+    ):
         key = (sig.token_id, sig.signal_type)
-        if key not in best or sig.strength > best[key].strength:
-            best[key] = sig
-
-    return sorted(best.values(), key=lambda s: s.strength, reverse=True)
+        if key in seen:
+            continue
+        seen.add(key)
+        ranked.append(sig)
+    return ranked
@@ -12,12 +12,14 @@ Usage::
 
 import json
 import logging
+from collections.abc import Iterable, Iterator
 from typing import Optional
 
 import asyncpg
 
 from src.config import CollectorConfig
 from src.db.queries.markets import upsert_markets
+from src.utils import fastjson
 from src.utils.client import PolymarketClient
 from src.utils.retry import gamma_limiter
 
@@ -32,7 +34,7 @@ class MarketMetadataCollector:
     pool:
         asyncpg connection pool for database writes.
     client:
-        PolymarketClient instance (provides ``get_all_active_markets``).
+        PolymarketClient instance (provides ``iter_active_event_pages``).
     config:
         Collector configuration (intervals, limits, etc.).
     """
@@ -68,7 +70,7 @@ class MarketMetadataCollector:
             clob_token_ids = raw_clob
         else:
             try:
-                parsed = json.loads(raw_clob)
+                parsed = fastjson.loads(raw_clob)
                 clob_token_ids = parsed if isinstance(parsed, list) else []
             except (json.JSONDecodeError, TypeError):
                 clob_token_ids = []
@@ -77,12 +79,14 @@ class MarketMetadataCollector:
         raw_outcomes = raw_market.get("outcomes", "")
         if isinstance(raw_outcomes, list):
             outcomes = raw_outcomes
-        else:
+        elif isinstance(raw_outcomes, str):
+            # Few distinct values (e.g. '["Yes", "No"]') -- memoized parse
             try:
-                parsed = json.loads(raw_outcomes)
-                outcomes = parsed if isinstance(parsed, list) else []
-            except (json.JSONDecodeError, TypeError):
+                outcomes = list(fastjson.loads_list(raw_outcomes) or ())
+            except json.JSONDecodeError:
                 outcomes = []
+        else:
+            outcomes = []
 
         # end_date_iso — try both camelCase and snake_case
         end_date_iso = (
@@ -108,40 +112,48 @@ class MarketMetadataCollector:
             "end_date_iso": end_date_iso,
         }
 
-    def _extract_markets_from_events(self, events: list[dict]) -> list[dict]:
-        """Flatten events into a list of market dicts ready for upsert.
+    def _iter_markets(self, events: Iterable[dict]) -> Iterator[dict]:
+        """Yield upsert-ready market dicts from a sequence of events.
 
         Each event contains a ``"markets"`` list.  Markets that fail
         extraction (missing condition_id, etc.) are silently skipped.
         """
-        market_dicts: list[dict] = []
+        extract = self._extract_market_data
         for event in events:
-            for raw_market in event.get("markets", []):
-                extracted = self._extract_market_data(raw_market)
-                if extracted is not None:
-                    market_dicts.append(extracted)
-        return market_dicts
+            raw_markets = event.get("markets")
+            if raw_markets:
+                # map/filter run the per-market loop in C; extracted dicts
+                # are never empty, so filter(None) only drops the Nones
+                yield from filter(None, map(extract, raw_markets))
+
+    def _extract_markets_from_events(self, events: list[dict]) -> list[dict]:
+        """Flatten events into a list of market dicts ready for upsert."""
+        return list(self._iter_markets(events))
 
     async def collect_once(self) -> int:
         """Run one collection cycle.
 
-        Acquires the Gamma rate limiter, fetches all active events via
-        pagination, extracts market metadata, and upserts to the DB.
+        Acquires the Gamma rate limiter, fetches active events page by
+        page, extracts market metadata as each page arrives (so only one
+        page of event trees is held at a time), and upserts to the DB.
 
         Returns the number of markets upserted, or 0 on error.
         Never raises — errors are logged so the daemon loop continues.
         """
         try:
             await gamma_limiter.acquire()
-            events = await self.client.get_all_active_markets(
+            market_dicts: list[dict] = []
+            event_count = 0
+            async for events in self.client.iter_active_event_pages(
                 max_events=self.config.max_markets,
-            )
-            market_dicts = self._extract_markets_from_events(events)
+            ):
+                event_count += len(events)
+                market_dicts.extend(self._iter_markets(events))
             await upsert_markets(self.pool, market_dicts)
             logger.info(
                 "Upserted %d markets from %d events",
                 len(market_dicts),
-                len(events),
+                event_count,
             )
             return len(market_dicts)
         except Exception:
@@ -16,10 +16,12 @@ Usage::
 
 import asyncio
 import logging
+import operator
 from datetime import datetime, timezone
 from typing import Optional
 
 import asyncpg
+import numpy as np
 
 from src.config import CollectorConfig
 from src.db.queries.markets import get_active_markets
@@ -34,6 +36,33 @@ logger = logging.getLogger(__name__)
 _CHUNK_SIZE = 20
 
 
+# Pull ``(price, size)`` from book levels in C, without a Python call per
+# level.  py-clob-client returns objects; raw API payloads are dicts.
+_object_level_fields = operator.attrgetter("price", "size")
+_dict_level_fields = operator.itemgetter("price", "size")
+
+
+def _levels_to_floats(raw_levels) -> list[list[float]]:
+    """Convert book levels to ``[[price, size], ...]`` floats.
+
+    Pulls the raw price/size pairs in one pass and parses them with a
+    single ``np.asarray`` call.  Values NumPy silently maps to NaN (such as
+    ``None``) are re-parsed with ``float()`` so they raise as before.
+    """
+    if not raw_levels:
+        return []
+    fields = (
+        _object_level_fields
+        if hasattr(raw_levels[0], "price")
+        else _dict_level_fields
+    )
+    pairs = list(map(fields, raw_levels))
+    parsed = np.asarray(pairs, dtype=np.float64)
+    if np.isnan(parsed).any():
+        return [[float(price), float(size)] for price, size in pairs]
+    return parsed.tolist()
+
+
 class OrderbookSnapshotCollector:
     """Collects orderbook snapshots from the CLOB API and inserts to the DB.
 
@@ -79,16 +108,8 @@ class OrderbookSnapshotCollector:
         """
         raw_bids = book.bids if hasattr(book, "bids") else book.get("bids", [])
         raw_asks = book.asks if hasattr(book, "asks") else book.get("asks", [])
-        bids = [
-            [float(level.price if hasattr(level, "price") else level["price"]),
-             float(level.size if hasattr(level, "size") else level["size"])]
-            for level in (raw_bids or [])
-        ]
-        asks = [
-            [float(level.price if hasattr(level, "price") else level["price"]),
-             float(level.size if hasattr(level, "size") else level["size"])]
-            for level in (raw_asks or [])
-        ]
+        bids = _levels_to_floats(raw_bids)
+        asks = _levels_to_floats(raw_asks)
 
         bids_dict = {"levels": bids}
         asks_dict = {"levels": asks}
@@ -142,10 +163,13 @@ class OrderbookSnapshotCollector:
 
         Queries active markets from the DB, extracts all token IDs,
         fetches orderbooks from the CLOB in batches, computes
-        spread/midpoint, and inserts snapshots to the DB.
+        spread/midpoint, and inserts each batch's snapshots to the DB
+        while the next batch is being fetched.
 
-        Returns the number of orderbook snapshots inserted, or 0 on error.
-        Never raises -- errors are logged so the daemon loop continues.
+        Returns the number of orderbook snapshots inserted.  If a later
+        chunk fails, snapshots from earlier chunks stay committed and are
+        counted; a failure before any insert returns 0.  Never raises --
+        errors are logged so the daemon loop continues.
         """
         try:
             markets = await get_active_markets(
@@ -171,14 +195,48 @@ class OrderbookSnapshotCollector:
                 for i in range(0, len(all_token_ids), _CHUNK_SIZE)
             ]
 
-            all_tuples: list[tuple] = []
-            for chunk in chunks:
-                books = await self._fetch_orderbooks(chunk)
-                for token_id, book in zip(chunk, books):
-                    row = self._extract_orderbook_tuple(token_id, book, ts)
-                    all_tuples.append(row)
+            # Pipeline: each chunk's insert runs while the next chunk's
+            # orderbooks are being fetched, hiding DB latency behind CLOB
+            # latency.  At most one insert is in flight at a time.
+            count = 0
+            pending_insert: Optional[asyncio.Task] = None
+            try:
+                for chunk in chunks:
+                    books = await self._fetch_orderbooks(chunk)
+                    tuples = [
+                        self._extract_orderbook_tuple(token_id, book, ts)
+                        for token_id, book in zip(chunk, books)
+                    ]
+                    if pending_insert is not None:
+                        count += await pending_insert
+                        pending_insert = None
+                    if tuples:
+                        pending_insert = asyncio.create_task(
+                            insert_orderbook_snapshots(self.pool, tuples)
+                        )
+                if pending_insert is not None:
+                    count += await pending_insert
+                    pending_insert = None
+            except asyncio.CancelledError:
+                if pending_insert is not None:
+                    pending_insert.cancel()
+                raise
+            except Exception:
+                # Earlier chunks are already committed; let the in-flight
+                # insert finish so its rows are counted rather than dropped.
+                if pending_insert is not None:
+                    (inserted,) = await asyncio.gather(
+                        pending_insert, return_exceptions=True
+                    )
+                    if not isinstance(inserted, BaseException):
+                        count += inserted
+                logger.error(
+                    "Orderbook snapshot collection failed after %d snapshots",
+                    count,
+                    exc_info=True,
+                )
+                return count
 
-            count = await insert_orderbook_snapshots(self.pool, all_tuples)
             logger.info(
                 "Inserted %d orderbook snapshots for %d tokens",
                 count,
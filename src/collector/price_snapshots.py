@@ -13,16 +13,51 @@ Usage::
 import json
 import logging
 from datetime import datetime, timezone
+from typing import Optional
 
 import asyncpg
+import numpy as np
 
 from src.config import CollectorConfig
 from src.db.queries.prices import insert_price_snapshots
+from src.utils import fastjson
 from src.utils.client import PolymarketClient
 from src.utils.retry import gamma_limiter
 
 logger = logging.getLogger(__name__)
 
+# Below this many prices, per-item float() beats NumPy's call overhead.
+_VECTORIZE_MIN_PRICES = 32
+
+
+def _parse_float(value) -> Optional[float]:
+    """Return ``float(value)``, or ``None`` if it is not a valid number."""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _parse_prices(raw_prices: list) -> list[Optional[float]]:
+    """Convert raw outcome prices to floats, ``None`` where invalid.
+
+    Large batches are converted in one ``np.asarray`` call.  NumPy maps
+    ``None`` to NaN where ``float()`` would raise, so NaN results are
+    re-checked per item; any batch NumPy rejects outright falls back to
+    per-item conversion.
+    """
+    if len(raw_prices) < _VECTORIZE_MIN_PRICES:
+        return [_parse_float(p) for p in raw_prices]
+    try:
+        prices = np.asarray(raw_prices, dtype=np.float64)
+    except (ValueError, TypeError):
+        return [_parse_float(p) for p in raw_prices]
+
+    result: list[Optional[float]] = prices.tolist()
+    for i in np.flatnonzero(np.isnan(prices)).tolist():
+        result[i] = _parse_float(raw_prices[i])
+    return result
+
 
 class PriceSnapshotCollector:
     """Collects per-token price snapshots from the Gamma API and bulk-inserts to the DB.
@@ -68,14 +103,17 @@ class PriceSnapshotCollector:
         list[tuple]
             Each tuple is ``(ts, token_id, price, volume_24h)``.
         """
-        tuples: list[tuple] = []
+        # Phase 1: walk events, collecting parallel token/price/volume lists
+        token_ids_out: list[str] = []
+        raw_prices: list = []
+        volumes: list[float] = []
 
         for event in events:
             for market in event.get("markets", []):
                 # Parse clobTokenIds (stringified JSON array)
                 raw_token_ids = market.get("clobTokenIds", "")
                 try:
-                    token_ids = json.loads(raw_token_ids)
+                    token_ids = fastjson.loads(raw_token_ids)
                     if not isinstance(token_ids, list):
                         continue
                 except (json.JSONDecodeError, TypeError):
@@ -86,15 +124,20 @@ class PriceSnapshotCollector:
                     continue
 
                 # Parse outcomePrices (stringified JSON array)
-                raw_prices = market.get("outcomePrices", "")
+                raw_prices_json = market.get("outcomePrices", "")
                 try:
-                    prices = json.loads(raw_prices)
-                    if not isinstance(prices, list):
+                    # Price arrays repeat across markets -- memoized parse
+                    prices = (
+                        fastjson.loads_list(raw_prices_json)
+                        if isinstance(raw_prices_json, str)
+                        else fastjson.loads(raw_prices_json)
+                    )
+                    if not isinstance(prices, (list, tuple)):
                         continue
                 except (json.JSONDecodeError, TypeError):
                     logger.warning(
                         "Skipping market — malformed outcomePrices: %.80s",
-                        raw_prices,
+                        raw_prices_json,
                     )
                     continue
 
@@ -105,18 +148,23 @@ class PriceSnapshotCollector:
                 for token_id, price_str in zip(token_ids, prices):
                     if not token_id:
                         continue
-                    try:
-                        price = float(price_str)
-                    except (ValueError, TypeError):
-                        logger.warning(
-                            "Skipping token %s — bad price: %.40s",
-                            token_id,
-                            price_str,
-                        )
-                        continue
-                    tuples.append(
-                        (ts, str(token_id), price, volume_24h)
-                    )
+                    token_ids_out.append(str(token_id))
+                    raw_prices.append(price_str)
+                    volumes.append(volume_24h)
+
+        # Phase 2: convert all prices at once; Phase 3: zip back
+        tuples: list[tuple] = []
+        for token_id, price, volume_24h, price_str in zip(
+            token_ids_out, _parse_prices(raw_prices), volumes, raw_prices
+        ):
+            if price is None:
+                logger.warning(
+                    "Skipping token %s — bad price: %.40s",
+                    token_id,
+                    price_str,
+                )
+                continue
+            tuples.append((ts, token_id, price, volume_24h))
 
         return tuples
 
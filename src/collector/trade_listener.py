@@ -1,9 +1,9 @@
 """WebSocket trade listener for Polymarket CLOB market channel.
 
 Connects to the Polymarket WebSocket trade stream, subscribes to active
-markets, and streams every ``last_trade_price`` event into an
-``asyncio.Queue``.  A drain loop batches queued trades and bulk-inserts
-them via ``insert_trades()``.
+markets, and streams every ``last_trade_price`` event into an in-memory
+queue.  A drain loop batches queued trades and bulk-inserts them via
+``insert_trades()``.
 
 Usage::
 
@@ -13,11 +13,16 @@ Usage::
 
 Key design decisions:
 - ``websockets`` async iterator for auto-reconnect (no hand-rolled retry)
-- ``asyncio.Queue`` decouples receive from DB writes
-- ``put_nowait`` in receive loop to avoid blocking (would miss heartbeat)
+- ``deque`` + one-shot wake future decouples receive from DB writes
+  (no per-item lock/getter bookkeeping as with ``asyncio.Queue``)
+- Non-blocking append in receive loop (blocking would miss heartbeat)
 - App-level ``"PING"`` every 10s (Polymarket requirement, separate from
   protocol ping/pong)
+- Frames decode straight into ``msgspec`` structs (no intermediate dicts),
+  falling back to per-event dict parsing for malformed frames
 - ``trade_id = None`` for all WS trades (not in event payload)
+- ``permessage-deflate`` disabled: frames are small, so inflating them costs
+  more CPU than the bandwidth is worth
 - Connection pooling: tokens chunked across multiple WS connections (max 500 each)
 - Single drain loop shared across all connections
 """
@@ -26,28 +31,64 @@ import asyncio
 import copy
 import json
 import logging
+import operator
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Optional
 
 import asyncpg
+import msgspec
 from websockets.asyncio.client import connect
-from websockets.exceptions import ConnectionClosed
+from websockets.exceptions import ConnectionClosed, ConnectionClosedOK
 
 from src.config import CollectorConfig, get_config
 from src.db.queries.markets import get_active_markets
 from src.db.queries.trades import insert_trades
+from src.utils import fastjson
 
 logger = logging.getLogger(__name__)
 
+# Trades held in memory before new ones are dropped.
+_MAX_QUEUED_TRADES = 10_000
 
-@dataclass
+_TRADE_EVENT_TYPE = "last_trade_price"
+# Pulls every trade field in one C call instead of five subscripts.
+_trade_fields = operator.itemgetter(
+    "asset_id", "side", "price", "size", "timestamp"
+)
+
+
+class _MarketEvent(msgspec.Struct):
+    """Market-channel event decoded with only the fields a trade needs.
+
+    Other event types (``book``, ``price_change``, ...) decode into the
+    same struct; their extra fields are skipped and missing ones are None.
+    """
+
+    event_type: Optional[str] = None
+    asset_id: Optional[str] = None
+    side: Optional[str] = None
+    price: Optional[float] = None
+    size: Optional[float] = None
+    timestamp: Optional[int] = None
+
+
+# strict=False converts the API's numeric strings ("0.52", "1700000000000")
+# to float/int while decoding.
+_decode_frame = msgspec.json.Decoder(
+    _MarketEvent | list[_MarketEvent], strict=False
+).decode
+
+
+@dataclass(slots=True)
 class TradeListenerHealth:
     """Observable health state for the TradeListener.
 
-    Updated in-place by the listener's internal loops.  Access a snapshot
-    via ``TradeListener.get_health()`` which returns a shallow copy with
-    the current ``queue_depth`` populated.
+    Updated in-place by the listener's internal loops (per trade, so the
+    class uses ``__slots__`` for cheaper attribute writes).  Access a
+    snapshot via ``TradeListener.get_health()`` which returns a shallow
+    copy with the current ``queue_depth`` populated.
     """
 
     trades_received: int = 0
@@ -85,19 +126,14 @@ def parse_trade_event(event: dict) -> Optional[tuple]:
     crash the receive loop.
     """
     try:
-        if event.get("event_type") != "last_trade_price":
+        if event.get("event_type") != _TRADE_EVENT_TYPE:
             return None
 
-        ts = datetime.fromtimestamp(
-            int(event["timestamp"]) / 1000, tz=timezone.utc
-        )
-        token_id = event["asset_id"]
-        side = event["side"]
-        price = float(event["price"])
-        size = float(event["size"])
+        token_id, side, raw_price, raw_size, raw_ts = _trade_fields(event)
+        ts = datetime.fromtimestamp(int(raw_ts) / 1000, tz=timezone.utc)
         trade_id = None  # Not in WS events (RESEARCH.md pitfall 2)
 
-        return (ts, token_id, side, price, size, trade_id)
+        return (ts, token_id, side, float(raw_price), float(raw_size), trade_id)
 
     except Exception:
         logger.warning(
@@ -108,6 +144,60 @@ def parse_trade_event(event: dict) -> Optional[tuple]:
         return None
 
 
+def parse_trade_frame(raw: bytes) -> list[tuple]:
+    """Parse one WebSocket frame into DB-ready trade tuples.
+
+    The frame is decoded straight into ``_MarketEvent`` structs, skipping
+    the intermediate dicts.  If that fails anywhere in the frame (bad JSON
+    types, a trade missing a field, an out-of-range timestamp), the frame
+    is re-parsed event by event with ``parse_trade_event()`` so that only
+    the malformed events are dropped.
+
+    Parameters
+    ----------
+    raw:
+        A frame from the CLOB WebSocket market channel: a JSON event or
+        a JSON array of events.
+
+    Returns
+    -------
+    list[tuple]
+        ``(ts, token_id, side, price, size, trade_id)`` tuples for the
+        ``last_trade_price`` events in the frame, in order.
+
+    Raises
+    ------
+    json.JSONDecodeError
+        If the frame is not valid JSON.
+    """
+    try:
+        decoded = _decode_frame(raw)
+        events = decoded if isinstance(decoded, list) else (decoded,)
+        trades: list[tuple] = []
+        for event in events:
+            if event.event_type != _TRADE_EVENT_TYPE:
+                continue
+            fields = (
+                event.asset_id, event.side, event.price, event.size,
+                event.timestamp,
+            )
+            if None in fields:
+                raise ValueError("trade event is missing a field")
+            ts = datetime.fromtimestamp(event.timestamp / 1000, tz=timezone.utc)
+            trades.append(
+                (ts, event.asset_id, event.side, event.price, event.size, None)
+            )
+        return trades
+    except (msgspec.DecodeError, ValueError, OverflowError, OSError):
+        parsed = fastjson.loads(raw)
+        events = parsed if isinstance(parsed, list) else [parsed]
+        return [
+            trade
+            for trade in map(parse_trade_event, events)
+            if trade is not None
+        ]
+
+
 class TradeListener:
     """WebSocket trade stream listener with producer-consumer queue.
 
@@ -132,24 +222,43 @@ class TradeListener:
         self.pool = pool
         self.config = config
         self._ws_url = get_config().polymarket.ws_host + "/ws/market"
-        self._queue: asyncio.Queue = asyncio.Queue(maxsize=10_000)
+        self._queue: deque[tuple] = deque()
+        # Set by _drain_loop while it waits on an empty queue
+        self._queue_wake: Optional[asyncio.Future] = None
         self._running = False
         self._tasks: list[asyncio.Task] = []
         self.health = TradeListenerHealth()
 
-    async def _subscribe(self, ws, token_ids: list[str]) -> None:
-        """Send subscription message for a list of token IDs.
+    @staticmethod
+    def _subscription_message(token_ids: list[str]) -> str:
+        """Serialize the market-channel subscription for ``token_ids``.
 
         Parameters
         ----------
-        ws:
-            An open WebSocket connection.
         token_ids:
             List of CLOB token IDs to subscribe to.
+
+        Returns
+        -------
+        str
+            JSON text frame to send on (re)connect.
         """
-        msg = json.dumps({"assets_ids": token_ids, "type": "market"})
-        await ws.send(msg)
-        logger.info("Subscribed to %d tokens", len(token_ids))
+        return json.dumps({"assets_ids": token_ids, "type": "market"})
+
+    async def _subscribe(self, ws, message: str, token_count: int) -> None:
+        """Send a pre-serialized subscription message.
+
+        Parameters
+        ----------
+        ws:
+            An open WebSocket connection.
+        message:
+            Output of ``_subscription_message()``.
+        token_count:
+            Number of tokens in the subscription (for logging).
+        """
+        await ws.send(message)
+        logger.info("Subscribed to %d tokens", token_count)
 
     async def _ping_loop(self, ws) -> None:
         """Send application-level PING at the configured interval.
@@ -173,54 +282,70 @@ class TradeListener:
         """Read messages from the WebSocket and enqueue parsed trades.
 
         Events may arrive as a single JSON dict or a JSON array of
-        dicts.  Each event is parsed via ``parse_trade_event()`` and
-        enqueued with ``put_nowait`` to avoid blocking the receive
-        loop (which would cause missed heartbeats).
+        dicts.  Each frame is parsed via ``parse_trade_frame()`` and its
+        trades appended to the queue without blocking the receive loop
+        (which would cause missed heartbeats), waking the drain loop if
+        idle.
+
+        Frames are received as raw bytes (``decode=False``) so websockets
+        skips UTF-8 decoding; the JSON parser reads the bytes directly.
+        Frames already buffered by websockets are returned without a trip
+        through the event loop, and health counters and the drain-loop
+        wake-up are updated once per frame rather than once per trade.
+        Returns when the connection closes normally.
 
         Parameters
         ----------
         ws:
             An open WebSocket connection.
         """
-        async for raw in ws:
-            parsed = json.loads(raw)
-            events = parsed if isinstance(parsed, list) else [parsed]
-            for event in events:
-                trade = parse_trade_event(event)
-                if trade is not None:
-                    try:
-                        self._queue.put_nowait(trade)
-                        self.health.trades_received += 1
-                        self.health.last_trade_ts = datetime.now(timezone.utc)
-                    except asyncio.QueueFull:
-                        logger.warning("Trade queue full, dropping event")
+        queue = self._queue
+        health = self.health
+        recv = ws.recv
+        while True:
+            try:
+                raw = await recv(decode=False)
+            except ConnectionClosedOK:
+                return
+            received = 0
+            for trade in parse_trade_frame(raw):
+                if len(queue) >= _MAX_QUEUED_TRADES:
+                    logger.warning("Trade queue full, dropping event")
+                    continue
+                queue.append(trade)
+                received += 1
+
+            if received:
+                health.trades_received += received
+                health.last_trade_ts = datetime.now(timezone.utc)
+                wake = self._queue_wake
+                if wake is not None and not wake.done():
+                    wake.set_result(None)
 
     async def _drain_loop(self) -> None:
         """Consume trades from the queue and batch-insert into the DB.
 
-        Waits for the first trade (with timeout), then greedily drains
-        up to ``trade_buffer_size`` items before inserting.  Continues
-        until ``_running`` is ``False`` and the queue is empty.
+        Sleeps only while the queue is empty.  As soon as a trade arrives
+        it takes everything queued (up to ``trade_buffer_size``) and
+        inserts it, so a lone trade is flushed immediately and a burst
+        goes out in full batches.  Continues until ``_running`` is
+        ``False`` and the queue is empty, or the task is cancelled.
         """
-        while self._running or not self._queue.empty():
-            batch: list[tuple] = []
-            try:
-                trade = await asyncio.wait_for(
-                    self._queue.get(),
-                    timeout=self.config.trade_batch_drain_timeout_sec,
-                )
-                batch.append(trade)
-            except asyncio.TimeoutError:
-                continue
-            except asyncio.CancelledError:
-                break
-
-            # Drain remaining items up to batch_size
-            while len(batch) < self.config.trade_buffer_size:
+        queue = self._queue
+        while self._running or queue:
+            if not queue:
+                self._queue_wake = asyncio.get_running_loop().create_future()
                 try:
-                    batch.append(self._queue.get_nowait())
-                except asyncio.QueueEmpty:
+                    await self._queue_wake
+                except asyncio.CancelledError:
                     break
+                finally:
+                    self._queue_wake = None
+
+            # Drain up to batch_size without awaiting
+            batch: list[tuple] = []
+            while queue and len(batch) < self.config.trade_buffer_size:
+                batch.append(queue.popleft())
 
             # Insert batch
             if batch:
@@ -242,7 +367,8 @@ class TradeListener:
 
         Uses the ``websockets`` async iterator pattern for automatic
         reconnection with exponential backoff.  Re-subscribes on every
-        (re)connect since subscriptions are ephemeral.
+        (re)connect since subscriptions are ephemeral; the subscription
+        message is serialized once and reused across reconnects.
 
         Parameters
         ----------
@@ -250,15 +376,18 @@ class TradeListener:
             List of CLOB token IDs to subscribe to on this connection
             (max 500 per Polymarket limit).
         """
+        sub_message = self._subscription_message(token_ids)
         first_connect = True
-        async for ws in connect(self._ws_url):
+        # Market-channel frames are small JSON; permessage-deflate would
+        # spend more CPU in zlib than it saves in bandwidth.
+        async for ws in connect(self._ws_url, compression=None):
             try:
                 self.health.connections_active += 1
                 if not first_connect:
                     self.health.reconnections += 1
                     self.health.last_reconnect_ts = datetime.now(timezone.utc)
                 first_connect = False
-                await self._subscribe(ws, token_ids)
+                await self._subscribe(ws, sub_message, len(token_ids))
                 ping_task = asyncio.create_task(self._ping_loop(ws))
                 try:
                     await self._receive_loop(ws)
@@ -364,12 +493,8 @@ class TradeListener:
         await asyncio.gather(*self._tasks, return_exceptions=True)
 
         # Drain remaining items from queue
-        remaining: list[tuple] = []
-        while not self._queue.empty():
-            try:
-                remaining.append(self._queue.get_nowait())
-            except asyncio.QueueEmpty:
-                break
+        remaining: list[tuple] = list(self._queue)
+        self._queue.clear()
 
         if remaining:
             try:
@@ -395,5 +520,5 @@ class TradeListener:
         TradeListenerHealth
             A copy of the health state with ``queue_depth`` populated.
         """
-        self.health.queue_depth = self._queue.qsize()
+        self.health.queue_depth = len(self._queue)
         return copy.copy(self.health)
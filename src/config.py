@@ -79,7 +79,6 @@ class CollectorConfig(BaseModel):
     max_markets: int = 10000
     ws_ping_interval_sec: int = 10
     ws_max_instruments_per_conn: int = 500
-    trade_batch_drain_timeout_sec: float = 5.0
 
 
 class TelegramConfig(BaseModel):
@@ -0,0 +1,7 @@
+-- Event slug prefix: market slug with any trailing "-<digits>" suffix removed.
+-- Lets same-event grouping run as a GROUP BY over an indexed column.
+ALTER TABLE markets
+    ADD COLUMN slug_prefix TEXT
+    GENERATED ALWAYS AS (regexp_replace(slug, '-[0-9]+$', '')) STORED;
+
+CREATE INDEX idx_markets_slug_prefix ON markets (slug_prefix) WHERE active = true;
@@ -29,6 +29,7 @@ class MarketRecord(BaseModel):
     active: bool = True
     closed: bool = False
     end_date_iso: Optional[str] = None
+    slug_prefix: Optional[str] = None  # generated column (migration 009)
     created_at: datetime
     updated_at: datetime
 
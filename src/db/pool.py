@@ -13,11 +13,12 @@ Usage::
 
 import asyncio
 import logging
-from typing import Optional
+from typing import Any, Optional
 
 import asyncpg
 
 from src.config import get_config
+from src.utils import fastjson
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +27,43 @@ _pool_closed: bool = True
 _pool_lock: asyncio.Lock | None = None
 
 
+async def register_jsonb_codec(conn: asyncpg.Connection) -> None:
+    """Encode/decode JSONB in binary wire format.
+
+    Run once per connection as the pool's ``init`` hook, so the type
+    introspection happens at connect time rather than per query.  Binary
+    JSONB is a ``0x01`` version byte followed by the JSON text, which skips
+    the server's text render of the column.
+    """
+    await conn.set_type_codec(
+        "jsonb",
+        encoder=lambda value: b"\x01" + fastjson.dumps(value).encode(),
+        decoder=lambda data: fastjson.loads(data[1:]),
+        schema="pg_catalog",
+        format="binary",
+    )
+
+
+def require_decoded_jsonb(value: Any) -> Any:
+    """Return a JSONB column value, failing if it arrived as raw text.
+
+    The orderbook readers rely on ``register_jsonb_codec``; on a pool
+    without it asyncpg returns JSONB as a ``str``, which the readers would
+    otherwise misread character by character.
+
+    Raises
+    ------
+    TypeError
+        If *value* is a ``str``.
+    """
+    if isinstance(value, str):
+        raise TypeError(
+            "JSONB column returned as text; create the pool with "
+            "init=register_jsonb_codec"
+        )
+    return value
+
+
 def _get_lock() -> asyncio.Lock:
     """Return the module-level pool lock, creating it lazily."""
     global _pool_lock
@@ -39,7 +77,8 @@ async def get_pool() -> asyncpg.Pool:
 
     Reads DSN and pool tuning parameters from ``get_config().database``.
     The pool is created once and reused for the lifetime of the process
-    (or until ``close_pool()`` is called).
+    (or until ``close_pool()`` is called).  Every connection decodes JSONB
+    columns to Python objects (see ``register_jsonb_codec``).
 
     Uses an asyncio.Lock to prevent concurrent callers from creating
     duplicate pools.
@@ -64,6 +103,7 @@ async def get_pool() -> asyncpg.Pool:
             max_size=db.max_pool_size,
             max_inactive_connection_lifetime=db.max_inactive_connection_lifetime,
             command_timeout=db.command_timeout,
+            init=register_jsonb_codec,
         )
         _pool_closed = False
 
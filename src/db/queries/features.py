@@ -5,12 +5,15 @@ and aggregations.  All functions return None or empty containers on error
 rather than raising, so callers can safely aggregate results.
 """
 
+import asyncio
 import logging
 import re
 from datetime import datetime, timedelta
 
 import asyncpg
 
+from src.db.pool import require_decoded_jsonb
+
 logger = logging.getLogger(__name__)
 
 
@@ -230,7 +233,8 @@ async def get_orderbook_imbalance(
     Imbalance = (bid_volume - ask_volume) / (bid_volume + ask_volume).
     Positive values indicate more buying pressure; negative indicate selling.
 
-    Bids and asks are stored as JSONB arrays of ``[price, size]`` pairs.
+    Bids and asks are stored as JSONB arrays of ``[price, size]`` pairs and
+    need a pool created with ``init=register_jsonb_codec``.
 
     Parameters
     ----------
@@ -245,31 +249,24 @@ async def get_orderbook_imbalance(
         Imbalance in [-1, 1], or None if no data or total volume is zero.
     """
     try:
-        import json
-
-        async with pool.acquire() as conn:
-            await conn.set_type_codec(
-                "jsonb",
-                encoder=json.dumps,
-                decoder=json.loads,
-                schema="pg_catalog",
-            )
-            row = await conn.fetchrow(
-                """
-                SELECT bids, asks
-                FROM orderbook_snapshots
-                WHERE token_id = $1
-                ORDER BY ts DESC
-                LIMIT 1
-                """,
-                token_id,
-            )
+        # bids/asks arrive decoded via the pool's JSONB codec; on a pool
+        # without it they are str and this logs the TypeError below
+        row = await pool.fetchrow(
+            """
+            SELECT bids, asks
+            FROM orderbook_snapshots
+            WHERE token_id = $1
+            ORDER BY ts DESC
+            LIMIT 1
+            """,
+            token_id,
+        )
 
         if row is None:
             return None
 
-        bids = row["bids"] or []
-        asks = row["asks"] or []
+        bids = require_decoded_jsonb(row["bids"]) or []
+        asks = require_decoded_jsonb(row["asks"]) or []
 
         bid_vol = sum(float(entry[1]) for entry in bids if len(entry) >= 2)
         ask_vol = sum(float(entry[1]) for entry in asks if len(entry) >= 2)
@@ -369,12 +366,22 @@ async def get_market_features(
         token_ids: list[str] = row["clob_token_ids"] or []
         result: dict = {}
         for token_id in token_ids:
+            # The five feature queries are independent, so run them on
+            # separate pool connections; one token at a time keeps a
+            # many-outcome market from claiming the whole pool.
+            returns, vol, spreads, imbalance, profile = await asyncio.gather(
+                get_price_returns(pool, token_id),
+                get_rolling_volatility(pool, token_id),
+                get_spread_history(pool, token_id),
+                get_orderbook_imbalance(pool, token_id),
+                get_trade_volume_profile(pool, token_id),
+            )
             result[token_id] = {
-                "price_returns": await get_price_returns(pool, token_id),
-                "volatility": await get_rolling_volatility(pool, token_id),
-                "spread_history": await get_spread_history(pool, token_id),
-                "orderbook_imbalance": await get_orderbook_imbalance(pool, token_id),
-                "volume_profile": await get_trade_volume_profile(pool, token_id),
+                "price_returns": returns,
+                "volatility": vol,
+                "spread_history": spreads,
+                "orderbook_imbalance": imbalance,
+                "volume_profile": profile,
             }
         return result
     except Exception:
@@ -47,14 +47,77 @@ async def upsert_market(pool: asyncpg.Pool, market_data: dict) -> None:
     )
 
 
+_MARKET_COLUMNS = [
+    "condition_id", "question", "slug", "market_type",
+    "outcomes", "clob_token_ids", "active", "closed", "end_date_iso",
+]
+
+
 async def upsert_markets(pool: asyncpg.Pool, markets: list[dict]) -> None:
     """Batch upsert multiple markets.
 
-    Loops over the list calling upsert_market for each entry.
-    Not performance-critical at 5-minute intervals for ~8K markets.
+    COPYs the batch into a transaction-scoped staging table, then merges
+    it into ``markets`` with a single INSERT ... SELECT ... ON CONFLICT,
+    so a collection cycle costs a fixed number of round-trips rather than
+    one per market.  If a condition_id appears more than once, the last
+    entry wins (matching repeated ``upsert_market`` calls).
     """
-    for market_data in markets:
-        await upsert_market(pool, market_data)
+    if not markets:
+        return
+
+    # ON CONFLICT DO UPDATE can't touch the same row twice in one statement
+    latest = {m["condition_id"]: m for m in markets}
+    records = [
+        (
+            m["condition_id"],
+            m["question"],
+            m.get("slug"),
+            m.get("market_type"),
+            m.get("outcomes", []),
+            m.get("clob_token_ids", []),
+            m.get("active", True),
+            m.get("closed", False),
+            m.get("end_date_iso"),
+        )
+        for m in latest.values()
+    ]
+
+    async with pool.acquire() as conn:
+        async with conn.transaction():
+            await conn.execute(
+                """
+                CREATE TEMP TABLE _markets_staging
+                    (LIKE markets INCLUDING DEFAULTS)
+                    ON COMMIT DROP
+                """
+            )
+            await conn.copy_records_to_table(
+                "_markets_staging",
+                records=records,
+                columns=_MARKET_COLUMNS,
+            )
+            await conn.execute(
+                """
+                INSERT INTO markets (
+                    condition_id, question, slug, market_type,
+                    outcomes, clob_token_ids, active, closed, end_date_iso
+                )
+                SELECT
+                    condition_id, question, slug, market_type,
+                    outcomes, clob_token_ids, active, closed, end_date_iso
+                FROM _markets_staging
+                ON CONFLICT (condition_id) DO UPDATE SET
+                    question = EXCLUDED.question,
+                    slug = EXCLUDED.slug,
+                    market_type = EXCLUDED.market_type,
+                    outcomes = EXCLUDED.outcomes,
+                    clob_token_ids = EXCLUDED.clob_token_ids,
+                    active = EXCLUDED.active,
+                    closed = EXCLUDED.closed,
+                    end_date_iso = EXCLUDED.end_date_iso,
+                    updated_at = NOW()
+                """
+            )
 
 
 async def get_market(
@@ -9,27 +9,27 @@ natively encode Python dicts as JSONB for the COPY protocol, so we use
 than price snapshots (~8K tokens every 5 min vs 60s), so the
 performance trade-off is acceptable.
 
-For reads, we set a JSONB type codec on the connection so that asyncpg
-automatically decodes JSONB strings to Python dicts.
+For reads, bids/asks arrive already decoded: the pool must register the
+binary JSONB codec on every connection (``init=register_jsonb_codec``, as
+``src.db.pool.get_pool`` does).  Readers raise ``TypeError`` on a pool
+without it rather than returning the raw JSON text.
 """
 
-import json
 from datetime import datetime
 from typing import Optional
 
 import asyncpg
 
 from src.db.models import OrderbookSnapshot, record_to_model
+from src.db.pool import require_decoded_jsonb
+from src.utils import fastjson
 
 
-async def _set_jsonb_codec(conn: asyncpg.Connection) -> None:
-    """Register a JSONB codec on a connection for automatic dict decoding."""
-    await conn.set_type_codec(
-        "jsonb",
-        encoder=json.dumps,
-        decoder=json.loads,
-        schema="pg_catalog",
-    )
+def _snapshot_from_row(row: asyncpg.Record) -> OrderbookSnapshot:
+    """Build an OrderbookSnapshot, checking bids/asks were decoded."""
+    require_decoded_jsonb(row["bids"])
+    require_decoded_jsonb(row["asks"])
+    return record_to_model(row, OrderbookSnapshot)
 
 
 async def insert_orderbook_snapshots(
@@ -39,6 +39,8 @@ async def insert_orderbook_snapshots(
 
     Uses ``executemany`` with explicit JSONB casting because asyncpg's
     COPY protocol does not natively handle Python dict -> JSONB encoding.
+    The JSON strings are bound as ``text`` and cast server-side, so the
+    insert behaves the same on pooled connections that carry a JSONB codec.
 
     Parameters
     ----------
@@ -47,7 +49,7 @@ async def insert_orderbook_snapshots(
     snapshots:
         List of tuples, each ``(ts, token_id, bids, asks, spread, midpoint)``.
         ``bids`` and ``asks`` should be Python dicts (or None) — they are
-        serialised to JSON strings for the JSONB cast.
+        serialised to JSON strings (with orjson) for the JSONB cast.
 
     Returns
     -------
@@ -58,16 +60,17 @@ async def insert_orderbook_snapshots(
         return 0
 
     # Convert dicts to JSON strings for the JSONB cast
+    dumps = fastjson.dumps
     prepared = [
-        (ts, token_id, json.dumps(bids) if bids is not None else None,
-         json.dumps(asks) if asks is not None else None, spread, midpoint)
+        (ts, token_id, dumps(bids) if bids is not None else None,
+         dumps(asks) if asks is not None else None, spread, midpoint)
         for ts, token_id, bids, asks, spread, midpoint in snapshots
     ]
 
     await pool.executemany(
         """
         INSERT INTO orderbook_snapshots (ts, token_id, bids, asks, spread, midpoint)
-        VALUES ($1, $2, $3::jsonb, $4::jsonb, $5, $6)
+        VALUES ($1, $2, $3::text::jsonb, $4::text::jsonb, $5, $6)
         """,
         prepared,
     )
@@ -91,21 +94,19 @@ async def get_latest_orderbook(
     OrderbookSnapshot or None
         The latest snapshot, or None if no data exists for the token.
     """
-    async with pool.acquire() as conn:
-        await _set_jsonb_codec(conn)
-        row = await conn.fetchrow(
-            """
-            SELECT ts, token_id, bids, asks, spread, midpoint
-            FROM orderbook_snapshots
-            WHERE token_id = $1
-            ORDER BY ts DESC
-            LIMIT 1
-            """,
-            token_id,
-        )
+    row = await pool.fetchrow(
+        """
+        SELECT ts, token_id, bids, asks, spread, midpoint
+        FROM orderbook_snapshots
+        WHERE token_id = $1
+        ORDER BY ts DESC
+        LIMIT 1
+        """,
+        token_id,
+    )
     if row is None:
         return None
-    return record_to_model(row, OrderbookSnapshot)
+    return _snapshot_from_row(row)
 
 
 async def get_orderbook_history(
@@ -135,21 +136,19 @@ async def get_orderbook_history(
     list[OrderbookSnapshot]
         Snapshots ordered by ``ts DESC`` (most recent first).
     """
-    async with pool.acquire() as conn:
-        await _set_jsonb_codec(conn)
-        rows = await conn.fetch(
-            """
-            SELECT ts, token_id, bids, asks, spread, midpoint
-            FROM orderbook_snapshots
-            WHERE token_id = $1
-              AND ts >= $2
-              AND ts <= $3
-            ORDER BY ts DESC
-            LIMIT $4
-            """,
-            token_id,
-            start,
-            end,
-            limit,
-        )
-    return [record_to_model(row, OrderbookSnapshot) for row in rows]
+    rows = await pool.fetch(
+        """
+        SELECT ts, token_id, bids, asks, spread, midpoint
+        FROM orderbook_snapshots
+        WHERE token_id = $1
+          AND ts >= $2
+          AND ts <= $3
+        ORDER BY ts DESC
+        LIMIT $4
+        """,
+        token_id,
+        start,
+        end,
+        limit,
+    )
+    return [_snapshot_from_row(row) for row in rows]
@@ -15,6 +15,18 @@ import asyncpg
 
 from src.db.models import PriceSnapshot, record_to_model
 
+# Scalar bounds on ts (not ``ts <@ tstzrange(...)``) so TimescaleDB can
+# exclude chunks outside the requested window.
+_PRICE_HISTORY_SQL = """
+    SELECT ts, token_id, price, volume_24h
+    FROM price_snapshots
+    WHERE token_id = $1
+      AND ts >= $2
+      AND ts <= $3
+    ORDER BY ts DESC
+    LIMIT $4
+"""
+
 
 async def insert_price_snapshots(
     pool: asyncpg.Pool, snapshots: list[tuple]
@@ -106,21 +118,7 @@ async def get_price_history(
     list[PriceSnapshot]
         Snapshots ordered by ``ts DESC`` (most recent first).
     """
-    rows = await pool.fetch(
-        """
-        SELECT ts, token_id, price, volume_24h
-        FROM price_snapshots
-        WHERE token_id = $1
-          AND ts >= $2
-          AND ts <= $3
-        ORDER BY ts DESC
-        LIMIT $4
-        """,
-        token_id,
-        start,
-        end,
-        limit,
-    )
+    rows = await pool.fetch(_PRICE_HISTORY_SQL, token_id, start, end, limit)
     return [record_to_model(row, PriceSnapshot) for row in rows]
 
 
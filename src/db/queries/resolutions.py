@@ -57,11 +57,12 @@ async def get_resolution(
     return record_to_model(row, ResolutionRecord)
 
 
-async def get_unresolved_markets(pool: asyncpg.Pool) -> list[str]:
+async def get_unresolved_markets(pool: asyncpg.Pool) -> set[str]:
     """Return condition_ids of closed markets that have no resolution record.
 
     Uses LEFT JOIN markets/resolutions WHERE r.condition_id IS NULL
-    AND m.closed = true.
+    AND m.closed = true.  Returned as a set: the ids are unique and
+    callers test membership.
     """
     rows = await pool.fetch(
         """
@@ -72,4 +73,4 @@ async def get_unresolved_markets(pool: asyncpg.Pool) -> list[str]:
           AND m.closed = true
         """
     )
-    return [row["condition_id"] for row in rows]
+    return {row["condition_id"] for row in rows}
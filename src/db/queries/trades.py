@@ -4,11 +4,13 @@ Provides bulk insert via COPY protocol and read operations for the
 ``trades`` hypertable.  All functions take an asyncpg pool as the first
 argument.
 
-Trades are high-volume events from the WebSocket feed.  COPY protocol
-is used for batch inserts (trade_buffer_size=1000 from CollectorConfig).
+Trades are high-volume events from the WebSocket feed.  Large batches
+(up to trade_buffer_size=1000 from CollectorConfig) use the COPY protocol.
 If a batch contains duplicate trade_ids that already exist in the table,
 the COPY will fail due to the unique index; in that case, we fall back
-to INSERT ... ON CONFLICT DO NOTHING.
+to INSERT ... ON CONFLICT DO NOTHING.  Small batches -- the common case
+when the trade listener flushes on arrival -- go straight to that
+pipelined INSERT, which beats COPY's per-call setup for a handful of rows.
 """
 
 from typing import Optional
@@ -17,10 +19,25 @@ import asyncpg
 
 from src.db.models import TradeRecord, record_to_model
 
+# Batches smaller than this skip COPY and use the pipelined INSERT.
+_COPY_MIN_ROWS = 50
+
+_TRADE_COLUMNS = ["ts", "token_id", "side", "price", "size", "trade_id"]
+
+_INSERT_TRADES_SQL = """
+    INSERT INTO trades (ts, token_id, side, price, size, trade_id)
+    VALUES ($1, $2, $3, $4, $5, $6)
+    ON CONFLICT (trade_id, ts) WHERE trade_id IS NOT NULL
+    DO NOTHING
+"""
+
 
 async def insert_trades(pool: asyncpg.Pool, trades: list[tuple]) -> int:
     """Bulk-insert trade records using the COPY protocol with duplicate fallback.
 
+    Batches under ``_COPY_MIN_ROWS`` rows are inserted with a single
+    pipelined ``executemany`` instead.
+
     Parameters
     ----------
     pool:
@@ -38,25 +55,21 @@ async def insert_trades(pool: asyncpg.Pool, trades: list[tuple]) -> int:
     if not trades:
         return 0
 
+    if len(trades) < _COPY_MIN_ROWS:
+        await pool.executemany(_INSERT_TRADES_SQL, trades)
+        return len(trades)
+
     try:
         await pool.copy_records_to_table(
             "trades",
             records=trades,
-            columns=["ts", "token_id", "side", "price", "size", "trade_id"],
+            columns=_TRADE_COLUMNS,
         )
         return len(trades)
     except asyncpg.UniqueViolationError:
         # COPY failed due to duplicate trade_id — fall back to
         # individual inserts with ON CONFLICT DO NOTHING.
-        await pool.executemany(
-            """
-            INSERT INTO trades (ts, token_id, side, price, size, trade_id)
-            VALUES ($1, $2, $3, $4, $5, $6)
-            ON CONFLICT (trade_id, ts) WHERE trade_id IS NOT NULL
-            DO NOTHING
-            """,
-            trades,
-        )
+        await pool.executemany(_INSERT_TRADES_SQL, trades)
         # Return batch length — the caller cares about "records processed".
         # (Previous code counted the entire table, which is wrong.)
         return len(trades)
@@ -121,3 +134,24 @@ async def get_trade_count(
             token_id,
         )
     return row["cnt"]
+
+
+async def get_trade_count_estimate(pool: asyncpg.Pool) -> int:
+    """Return the planner's estimate of the total number of trades.
+
+    Reads TimescaleDB's ``approximate_row_count``, which sums the chunks'
+    ``pg_class.reltuples`` instead of scanning every row.  The figure is
+    only as fresh as the last ANALYZE (or autovacuum), so use
+    ``get_trade_count`` when an exact number matters.
+
+    Parameters
+    ----------
+    pool:
+        asyncpg connection pool.
+
+    Returns
+    -------
+    int
+        Estimated number of trade records (0 for never-analyzed chunks).
+    """
+    return await pool.fetchval("SELECT approximate_row_count('trades')")
@@ -8,7 +8,7 @@ Main entry point for the bot.
 import asyncio
 import logging
 import sys
-from typing import Optional
+from typing import Any, Coroutine, Optional, TypeVar
 
 import click
 from rich.console import Console
@@ -20,6 +20,22 @@ from src.scanner.main import MarketScanner
 console = Console()
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+def _run_with_uvloop(main: Coroutine[Any, Any, T]) -> T:
+    """Run *main* on uvloop's libuv-backed event loop when it is installed.
+
+    Uses ``uvloop.run`` rather than the deprecated ``uvloop.install``, and
+    falls back to ``asyncio.run`` without uvloop.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        logger.debug("uvloop not installed, using the default asyncio loop")
+        return asyncio.run(main)
+    return uvloop.run(main)
+
 
 def setup_logging(level: str = "INFO", log_file: Optional[str] = None):
     """Configure logging."""
@@ -184,7 +200,7 @@ def collect(ctx):
             await close_pool()
             logger.info("Collector daemon shut down")
 
-    asyncio.run(run_daemon())
+    _run_with_uvloop(run_daemon())
 
 
 @cli.command()
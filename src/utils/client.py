@@ -2,7 +2,7 @@
 
 import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 import httpx
 from py_clob_client.client import ClobClient
@@ -10,18 +10,30 @@ from py_clob_client.clob_types import BookParams, OrderArgs, MarketOrderArgs, Or
 from py_clob_client.order_builder.constants import BUY, SELL
 
 from src.config import Config, get_config
+from src.utils import fastjson
 from src.utils.heartbeat import HeartbeatManager
 
 logger = logging.getLogger(__name__)
 
+# Gamma event pages requested concurrently per pagination round.  Kept
+# small so rounds (plus the inter-round delay) stay within Gamma's
+# 200 requests / 10s limit.
+_GAMMA_PAGE_CONCURRENCY = 2
+
 
 class PolymarketClient:
     """Wrapper around Polymarket APIs with async support."""
 
-    def __init__(self, config: Optional[Config] = None):
+    def __init__(
+        self,
+        config: Optional[Config] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
         self.config = config or get_config()
         self._clob_client: Optional[ClobClient] = None
         self._http_client: Optional[httpx.AsyncClient] = None
+        # Custom Gamma transport (e.g. httpx.MockTransport in tests)
+        self._transport = transport
         self._authenticated = False
         self._heartbeat: Optional[HeartbeatManager] = None
 
@@ -38,7 +50,9 @@ class PolymarketClient:
         if self._http_client is None:
             self._http_client = httpx.AsyncClient(
                 timeout=30.0,
-                headers={"User-Agent": "polymarket-stat-arb/1.0"}
+                headers={"User-Agent": "polymarket-stat-arb/1.0"},
+                http2=True,
+                transport=self._transport,
             )
         return self._http_client
 
@@ -123,51 +137,81 @@ class PolymarketClient:
         url = f"{self.config.polymarket.gamma_host}/events"
         response = await self.http.get(url, params=params)
         response.raise_for_status()
-        return response.json()
+        return fastjson.loads(response.content)
 
     async def get_event(self, event_id: str) -> Dict[str, Any]:
         """Fetch single event details."""
         url = f"{self.config.polymarket.gamma_host}/events/{event_id}"
         response = await self.http.get(url)
         response.raise_for_status()
-        return response.json()
+        return fastjson.loads(response.content)
 
-    async def get_all_active_markets(
+    async def iter_active_event_pages(
         self, max_events: Optional[int] = None
-    ) -> List[Dict[str, Any]]:
-        """Fetch active markets with pagination.
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield active events one Gamma API page at a time.
+
+        Lets callers flatten each page as it arrives instead of holding
+        every event tree in memory until pagination finishes.  Pages are
+        requested ``_GAMMA_PAGE_CONCURRENCY`` at a time (multiplexed over
+        one HTTP/2 connection) and yielded in offset order.
 
         Parameters
         ----------
         max_events:
-            Stop after accumulating this many events.  ``None`` means no limit,
-            but callers should pass ``config.collector.max_markets`` to avoid
-            unbounded memory growth on large Polymarket event sets.
+            Stop after yielding this many events in total.  ``None`` means
+            no limit.
         """
-        all_events: List[Dict[str, Any]] = []
         offset = 0
         limit = 100
+        remaining = max_events
 
         while True:
-            data = await self.get_events(active=True, limit=limit, offset=offset)
-            events = data if isinstance(data, list) else data.get("data", [])
+            pages = _GAMMA_PAGE_CONCURRENCY
+            if remaining is not None:
+                # Don't request pages past max_events
+                pages = max(1, min(pages, -(-remaining // limit)))
+            results = await asyncio.gather(*(
+                self.get_events(active=True, limit=limit, offset=offset + i * limit)
+                for i in range(pages)
+            ))
+            offset += pages * limit
 
-            if not events:
-                break
+            for data in results:
+                events = data if isinstance(data, list) else data.get("data", [])
 
-            all_events.extend(events)
-            offset += limit
+                if not events:
+                    return
+
+                if remaining is not None and len(events) >= remaining:
+                    yield events[:remaining]
+                    return
 
-            if max_events is not None and len(all_events) >= max_events:
-                all_events = all_events[:max_events]
-                break
+                yield events
+                if remaining is not None:
+                    remaining -= len(events)
 
-            if len(events) < limit:
-                break
+                if len(events) < limit:
+                    return
 
             # Small delay to respect rate limits
             await asyncio.sleep(0.1)
 
+    async def get_all_active_markets(
+        self, max_events: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Fetch active markets with pagination.
+
+        Parameters
+        ----------
+        max_events:
+            Stop after accumulating this many events.  ``None`` means no limit,
+            but callers should pass ``config.collector.max_markets`` to avoid
+            unbounded memory growth on large Polymarket event sets.
+        """
+        all_events: List[Dict[str, Any]] = []
+        async for events in self.iter_active_event_pages(max_events=max_events):
+            all_events.extend(events)
         return all_events
 
     # =========================================================================
@@ -0,0 +1,50 @@
+"""Fast JSON encoding and decoding for hot paths.
+
+Provides:
+- ``loads``: ``orjson.loads`` when orjson is installed, else ``json.loads``
+- ``loads_list``: memoized decode of a JSON-array string into a tuple
+- ``dumps``: compact JSON ``str`` via orjson, else ``json.dumps``
+
+The decoders accept ``str`` or ``bytes`` and raise ``json.JSONDecodeError`` (a
+``ValueError``) on malformed input -- ``orjson.JSONDecodeError`` subclasses
+it -- so callers can keep catching the stdlib exception types.
+
+Usage:
+    from src.utils.fastjson import loads, loads_list
+
+    token_ids = loads(raw_market["clobTokenIds"])
+    events = loads(response.content)
+    outcomes = list(loads_list('["Yes", "No"]'))
+    payload = dumps({"levels": [[0.5, 100.0]]})
+"""
+
+import functools
+import json
+from typing import Optional
+
+try:
+    import orjson
+
+    loads = orjson.loads
+
+    def dumps(obj) -> str:
+        """Serialize ``obj`` to a JSON ``str`` (orjson emits UTF-8 bytes)."""
+        return orjson.dumps(obj).decode()
+
+except ImportError:  # pragma: no cover - orjson is listed in requirements.txt
+    loads = json.loads
+    dumps = json.dumps
+
+
+@functools.lru_cache(maxsize=4096)
+def loads_list(raw: str) -> Optional[tuple]:
+    """Decode a JSON-array string, memoizing by the string value.
+
+    Gamma API markets repeat the same short array strings (e.g.
+    ``'["Yes", "No"]'``) across a collection cycle, so repeat parses become
+    cache hits.  Returns an immutable tuple so cached values can't be
+    mutated by callers, or ``None`` if the JSON is not an array.  Raises
+    ``json.JSONDecodeError`` on malformed input (errors are not cached).
+    """
+    parsed = loads(raw)
+    return tuple(parsed) if isinstance(parsed, list) else None
@@ -1,8 +1,9 @@
 """Shared fixtures for analysis tests.
 
-Re-exports the migrated_pool fixture from tests/db/conftest.py.
+Re-exports the migrated_pool fixture (and the class-scoped
+_migrated_schema it depends on) from tests/db/conftest.py.
 """
 
-from tests.db.conftest import migrated_pool
+from tests.db.conftest import _migrated_schema, migrated_pool
 
-__all__ = ["migrated_pool"]
+__all__ = ["_migrated_schema", "migrated_pool"]
@@ -9,10 +9,12 @@ Tests cover:
 
 import json
 from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
 
 import asyncpg
 import pytest
 
+from src.analysis import relationships
 from src.analysis.relationships import (
     MarketGroup,
     compute_price_correlation,
@@ -30,21 +32,23 @@ from src.analysis.relationships import (
 BASE_TS = datetime(2026, 1, 20, 10, 0, 0, tzinfo=timezone.utc)
 
 
-async def _insert_market(
-    pool: asyncpg.Pool,
+_INSERT_MARKET_SQL = """
+    INSERT INTO markets (
+        condition_id, question, slug, market_type,
+        outcomes, clob_token_ids, active, closed, end_date_iso
+    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+    ON CONFLICT (condition_id) DO NOTHING
+"""
+
+
+def _market_row(
     condition_id: str,
     slug: str,
     token_ids: list[str],
     active: bool = True,
-) -> None:
-    await pool.execute(
-        """
-        INSERT INTO markets (
-            condition_id, question, slug, market_type,
-            outcomes, clob_token_ids, active, closed, end_date_iso
-        ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
-        ON CONFLICT (condition_id) DO NOTHING
-        """,
+) -> tuple:
+    """Build the ``_INSERT_MARKET_SQL`` arguments for one binary market."""
+    return (
         condition_id,
         f"Question for {slug}?",
         slug,
@@ -57,6 +61,18 @@ async def _insert_market(
     )
 
 
+async def _insert_market(
+    pool: asyncpg.Pool,
+    condition_id: str,
+    slug: str,
+    token_ids: list[str],
+    active: bool = True,
+) -> None:
+    await pool.execute(
+        _INSERT_MARKET_SQL, *_market_row(condition_id, slug, token_ids, active)
+    )
+
+
 async def _insert_hourly_prices(
     pool: asyncpg.Pool,
     token_id: str,
@@ -64,10 +80,10 @@ async def _insert_hourly_prices(
     start: datetime = BASE_TS,
 ) -> None:
     """Insert one price snapshot per hour."""
-    records = [
+    records = (
         (start + timedelta(hours=i), token_id, price, None)
         for i, price in enumerate(prices)
-    ]
+    )
     await pool.copy_records_to_table(
         "price_snapshots",
         records=records,
@@ -131,6 +147,41 @@ class TestFindSameEventMarkets:
         prefixes = {g.slug_prefix for g in groups}
         assert "inactive-event" not in prefixes
 
+    async def test_memoized_groups_refresh_on_new_market(
+        self, migrated_pool: asyncpg.Pool
+    ) -> None:
+        """A repeat call reuses the grouping until the markets table changes."""
+        await _insert_market(migrated_pool, "cond_m1", "memo-event-1", ["tok_m1"])
+        await _insert_market(migrated_pool, "cond_m2", "memo-event-2", ["tok_m2"])
+
+        first = await find_same_event_markets(migrated_pool)
+        second = await find_same_event_markets(migrated_pool)
+        assert [g.condition_ids for g in first] == [g.condition_ids for g in second]
+
+        await _insert_market(migrated_pool, "cond_m3", "memo-event-3", ["tok_m3"])
+        groups = await find_same_event_markets(migrated_pool)
+
+        memo_group = next(g for g in groups if g.slug_prefix == "memo-event")
+        assert set(memo_group.condition_ids) == {"cond_m1", "cond_m2", "cond_m3"}
+
+    async def test_mutating_result_does_not_corrupt_cache(
+        self, migrated_pool: asyncpg.Pool
+    ) -> None:
+        """Callers get their own copies of the memoized groups."""
+        await _insert_market(migrated_pool, "cond_c1", "copy-event-1", ["tok_c1"])
+        await _insert_market(migrated_pool, "cond_c2", "copy-event-2", ["tok_c2"])
+
+        first = await find_same_event_markets(migrated_pool)
+        group = next(g for g in first if g.slug_prefix == "copy-event")
+        group.condition_ids.clear()
+        group.token_ids.append("tok_bogus")
+        first.clear()
+
+        second = await find_same_event_markets(migrated_pool)
+        group = next(g for g in second if g.slug_prefix == "copy-event")
+        assert group.condition_ids == ["cond_c1", "cond_c2"]
+        assert group.token_ids == ["tok_c1", "tok_c2"]
+
 
 # ---------------------------------------------------------------------------
 # Phase 2.2 — compute_price_correlation
@@ -216,9 +267,11 @@ class TestFindCorrelatedPairs:
         await _insert_hourly_prices(migrated_pool, "tok_cp_a", prices, start=start)
         await _insert_hourly_prices(migrated_pool, "tok_cp_b", prices, start=start)
 
-        pairs = await find_correlated_pairs(
-            migrated_pool, min_correlation=0.9, lookback_hours=48
-        )
+        pairs = [
+            p async for p in find_correlated_pairs(
+                migrated_pool, min_correlation=0.9, lookback_hours=48
+            )
+        ]
 
         token_pairs = {(p[0], p[1]) for p in pairs} | {(p[1], p[0]) for p in pairs}
         assert ("tok_cp_a", "tok_cp_b") in token_pairs or \
@@ -237,19 +290,102 @@ class TestFindCorrelatedPairs:
         await _insert_hourly_prices(migrated_pool, "tok_unc_a", prices_a, start=start)
         await _insert_hourly_prices(migrated_pool, "tok_unc_b", prices_b, start=start)
 
-        pairs = await find_correlated_pairs(
-            migrated_pool, min_correlation=0.95, lookback_hours=48
-        )
+        pairs = [
+            p async for p in find_correlated_pairs(
+                migrated_pool, min_correlation=0.95, lookback_hours=48
+            )
+        ]
 
         token_pairs = {(p[0], p[1]) for p in pairs} | {(p[1], p[0]) for p in pairs}
         assert ("tok_unc_a", "tok_unc_b") not in token_pairs and \
                ("tok_unc_b", "tok_unc_a") not in token_pairs
 
+    async def test_failing_pair_does_not_end_scan(
+        self, migrated_pool: asyncpg.Pool
+    ) -> None:
+        """A pair whose correlation raises is skipped; later pairs still yield."""
+        prices = [0.50 + i * 0.005 for i in range(30)]
+        start = datetime.now(timezone.utc) - timedelta(hours=30)
+        for token_id in ("tok_fp_a", "tok_fp_b", "tok_fp_c"):
+            await _insert_hourly_prices(migrated_pool, token_id, prices, start=start)
+
+        real = relationships._aligned_correlation
+        calls = 0
+
+        def fail_first(a, b, lookback_us):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise ValueError("bad series")
+            return real(a, b, lookback_us)
+
+        with patch.object(relationships, "_aligned_correlation", fail_first):
+            pairs = [
+                p async for p in find_correlated_pairs(
+                    migrated_pool, min_correlation=0.9, lookback_hours=48
+                )
+            ]
+
+        assert calls == 3
+        assert len(pairs) == 2
+
     async def test_empty_db_returns_empty(
         self, migrated_pool: asyncpg.Pool
     ) -> None:
         """No price data returns empty list."""
-        pairs = await find_correlated_pairs(migrated_pool, lookback_hours=24)
+        pairs = [
+            p async for p in find_correlated_pairs(migrated_pool, lookback_hours=24)
+        ]
+        assert pairs == []
+
+    async def test_matches_compute_price_correlation(
+        self, migrated_pool: asyncpg.Pool
+    ) -> None:
+        """NumPy-aligned pair correlation matches the SQL single-pair path."""
+        import math
+        now = datetime.now(timezone.utc)
+        # Offset series: only the overlapping hours align
+        prices_a = [0.50 + 0.1 * math.sin(i * 0.2) for i in range(30)]
+        prices_b = [0.40 + 0.05 * math.sin(i * 0.2 + 0.4) for i in range(30)]
+        await _insert_hourly_prices(
+            migrated_pool, "tok_mx_a", prices_a, start=now - timedelta(hours=40)
+        )
+        await _insert_hourly_prices(
+            migrated_pool, "tok_mx_b", prices_b, start=now - timedelta(hours=30)
+        )
+
+        pairs = [
+            p async for p in find_correlated_pairs(
+                migrated_pool, min_correlation=0.0, lookback_hours=24
+            )
+        ]
+        expected = await compute_price_correlation(
+            migrated_pool, "tok_mx_a", "tok_mx_b", lookback_hours=24
+        )
+
+        assert expected is not None
+        assert len(pairs) == 1
+        assert abs(pairs[0][2] - expected) < 1e-9
+
+    async def test_flat_series_not_correlated(
+        self, migrated_pool: asyncpg.Pool
+    ) -> None:
+        """Constant series yield no pair, matching the SQL path's None."""
+        now = datetime.now(timezone.utc)
+        start = now - timedelta(hours=3)
+        await _insert_hourly_prices(migrated_pool, "tok_flat_a", [0.05] * 3, start=start)
+        await _insert_hourly_prices(migrated_pool, "tok_flat_b", [0.37] * 3, start=start)
+
+        pairs = [
+            p async for p in find_correlated_pairs(
+                migrated_pool, min_correlation=0.0, lookback_hours=24
+            )
+        ]
+        expected = await compute_price_correlation(
+            migrated_pool, "tok_flat_a", "tok_flat_b", lookback_hours=24
+        )
+
+        assert expected is None
         assert pairs == []
 
 
@@ -265,29 +401,35 @@ class TestDetectMispricing:
         self, pool: asyncpg.Pool, prices: list[float]
     ) -> MarketGroup:
         """Insert N binary markets with given YES-token prices."""
-        condition_ids = []
-        token_ids = []
         now = datetime.now(timezone.utc)
-
-        for i, price in enumerate(prices):
-            cid = f"cond_mp_{i}"
-            yes_tok = f"tok_mp_yes_{i}"
-            no_tok = f"tok_mp_no_{i}"
-            await _insert_market(pool, cid, f"event-group-mp-{i+1}", [yes_tok, no_tok])
-            condition_ids.append(cid)
-            token_ids.extend([yes_tok, no_tok])
-
-            # Insert latest price for YES token
-            await pool.execute(
-                """
-                INSERT INTO price_snapshots (ts, token_id, price, volume_24h)
-                VALUES ($1, $2, $3, $4)
-                """,
-                now,
-                yes_tok,
-                price,
-                None,
-            )
+        condition_ids = [f"cond_mp_{i}" for i in range(len(prices))]
+        token_ids = [
+            tok
+            for i in range(len(prices))
+            for tok in (f"tok_mp_yes_{i}", f"tok_mp_no_{i}")
+        ]
+
+        # One batched round trip per table instead of two per market
+        await pool.executemany(
+            _INSERT_MARKET_SQL,
+            [
+                _market_row(
+                    condition_id,
+                    f"event-group-mp-{i+1}",
+                    token_ids[2 * i : 2 * i + 2],
+                )
+                for i, condition_id in enumerate(condition_ids)
+            ],
+        )
+        # Latest price for each YES token (every other token id)
+        await pool.copy_records_to_table(
+            "price_snapshots",
+            records=[
+                (now, yes_token_id, price, None)
+                for yes_token_id, price in zip(token_ids[::2], prices)
+            ],
+            columns=["ts", "token_id", "price", "volume_24h"],
+        )
 
         return MarketGroup(
             slug_prefix="event-group-mp",
@@ -7,7 +7,7 @@ Tests cover:
 4. get_all_signals - deduplication and ranking
 """
 
-import json
+import asyncio
 from datetime import datetime, timedelta, timezone
 
 import asyncpg
@@ -29,6 +29,10 @@ from src.analysis.signals import (
 
 BASE_TS = datetime(2026, 1, 25, 8, 0, 0, tzinfo=timezone.utc)
 
+# The insert helpers below use constant SQL text on purpose: asyncpg keeps a
+# per-connection prepared-statement cache, so with the session-shared pool
+# each statement is parsed and planned once per connection, not per call.
+
 
 async def _insert_market(
     pool: asyncpg.Pool,
@@ -79,10 +83,33 @@ async def _insert_prices_bulk(
     start: datetime,
     interval_minutes: int = 1,
 ) -> None:
-    records = [
+    records = (
         (start + timedelta(minutes=i * interval_minutes), token_id, price, None)
         for i, price in enumerate(prices)
+    )
+    await pool.copy_records_to_table(
+        "price_snapshots",
+        records=records,
+        columns=["ts", "token_id", "price", "volume_24h"],
+    )
+
+
+async def _insert_baseline_with_spike(
+    pool: asyncpg.Pool,
+    token_id: str,
+    baseline: float,
+    spike: float,
+    now: datetime,
+    count: int = 100,
+) -> None:
+    """COPY ``count`` one-minute baseline prices from ``now - 3h`` plus a
+    final ``spike`` price at ``now`` in a single round trip."""
+    start = now - timedelta(hours=3)
+    records = [
+        (start + timedelta(minutes=i), token_id, baseline, None)
+        for i in range(count)
     ]
+    records.append((now, token_id, spike, None))
     await pool.copy_records_to_table(
         "price_snapshots",
         records=records,
@@ -101,12 +128,12 @@ async def _insert_orderbook(
     await pool.execute(
         """
         INSERT INTO orderbook_snapshots (ts, token_id, bids, asks, spread, midpoint)
-        VALUES ($1, $2, $3::jsonb, $4::jsonb, $5, $6)
+        VALUES ($1, $2, $3, $4, $5, $6)
         """,
         ts,
         token_id,
-        json.dumps([[midpoint - spread / 2, 100.0]]),
-        json.dumps([[midpoint + spread / 2, 100.0]]),
+        [[midpoint - spread / 2, 100.0]],
+        [[midpoint + spread / 2, 100.0]],
         spread,
         midpoint,
     )
@@ -125,12 +152,13 @@ class TestGenerateSameEventSignals:
     ) -> None:
         """When YES prices sum < 1.0, underpriced tokens get buy signals."""
         now = datetime.now(timezone.utc)
-        await _insert_market(migrated_pool, "cond_se1", "sig-event-1", ["tok_se1_yes", "tok_se1_no"])
-        await _insert_market(migrated_pool, "cond_se2", "sig-event-2", ["tok_se2_yes", "tok_se2_no"])
-
         # YES prices: 0.40 + 0.45 = 0.85 -> under-priced
-        await _insert_price(migrated_pool, "tok_se1_yes", 0.40, ts=now)
-        await _insert_price(migrated_pool, "tok_se2_yes", 0.45, ts=now)
+        await asyncio.gather(
+            _insert_market(migrated_pool, "cond_se1", "sig-event-1", ["tok_se1_yes", "tok_se1_no"]),
+            _insert_market(migrated_pool, "cond_se2", "sig-event-2", ["tok_se2_yes", "tok_se2_no"]),
+            _insert_price(migrated_pool, "tok_se1_yes", 0.40, ts=now),
+            _insert_price(migrated_pool, "tok_se2_yes", 0.45, ts=now),
+        )
 
         signals = await generate_same_event_signals(migrated_pool)
 
@@ -143,12 +171,13 @@ class TestGenerateSameEventSignals:
     ) -> None:
         """When YES prices sum > 1.0, overpriced tokens get sell signals."""
         now = datetime.now(timezone.utc)
-        await _insert_market(migrated_pool, "cond_se3", "sig-over-1", ["tok_so1_yes", "tok_so1_no"])
-        await _insert_market(migrated_pool, "cond_se4", "sig-over-2", ["tok_so2_yes", "tok_so2_no"])
-
         # YES prices: 0.60 + 0.55 = 1.15 -> over-priced
-        await _insert_price(migrated_pool, "tok_so1_yes", 0.60, ts=now)
-        await _insert_price(migrated_pool, "tok_so2_yes", 0.55, ts=now)
+        await asyncio.gather(
+            _insert_market(migrated_pool, "cond_se3", "sig-over-1", ["tok_so1_yes", "tok_so1_no"]),
+            _insert_market(migrated_pool, "cond_se4", "sig-over-2", ["tok_so2_yes", "tok_so2_no"]),
+            _insert_price(migrated_pool, "tok_so1_yes", 0.60, ts=now),
+            _insert_price(migrated_pool, "tok_so2_yes", 0.55, ts=now),
+        )
 
         signals = await generate_same_event_signals(migrated_pool)
 
@@ -160,11 +189,12 @@ class TestGenerateSameEventSignals:
     ) -> None:
         """When YES prices sum ≈ 1.0 within tolerance, no same_event signals."""
         now = datetime.now(timezone.utc)
-        await _insert_market(migrated_pool, "cond_se5", "balanced-event-1", ["tok_bal1", "tok_bal2"])
-        await _insert_market(migrated_pool, "cond_se6", "balanced-event-2", ["tok_bal3", "tok_bal4"])
-
-        await _insert_price(migrated_pool, "tok_bal1", 0.50, ts=now)
-        await _insert_price(migrated_pool, "tok_bal3", 0.50, ts=now)
+        await asyncio.gather(
+            _insert_market(migrated_pool, "cond_se5", "balanced-event-1", ["tok_bal1", "tok_bal2"]),
+            _insert_market(migrated_pool, "cond_se6", "balanced-event-2", ["tok_bal3", "tok_bal4"]),
+            _insert_price(migrated_pool, "tok_bal1", 0.50, ts=now),
+            _insert_price(migrated_pool, "tok_bal3", 0.50, ts=now),
+        )
 
         signals = await generate_same_event_signals(migrated_pool)
         same_event_sigs = [s for s in signals if s.signal_type == "same_event"]
@@ -192,14 +222,10 @@ class TestGenerateMeanReversionSignals:
         self, migrated_pool: asyncpg.Pool
     ) -> None:
         """Price far above mean -> sell signal."""
-        now = datetime.now(timezone.utc)
-        start = now - timedelta(hours=3)
-
-        # 100 prices near 0.50, then spike to 0.90
-        stable_prices = [0.50] * 100
-        await _insert_prices_bulk(migrated_pool, "tok_mr1", stable_prices, start=start)
-        # Insert the spike as the most recent
-        await _insert_price(migrated_pool, "tok_mr1", 0.90, ts=now)
+        # 100 prices near 0.50, then spike to 0.90 as the most recent
+        await _insert_baseline_with_spike(
+            migrated_pool, "tok_mr1", 0.50, 0.90, datetime.now(timezone.utc)
+        )
 
         signals = await generate_mean_reversion_signals(
             migrated_pool, z_threshold=2.0, lookback_hours=6
@@ -213,12 +239,9 @@ class TestGenerateMeanReversionSignals:
         self, migrated_pool: asyncpg.Pool
     ) -> None:
         """Price far below mean -> buy signal."""
-        now = datetime.now(timezone.utc)
-        start = now - timedelta(hours=3)
-
-        stable_prices = [0.70] * 100
-        await _insert_prices_bulk(migrated_pool, "tok_mr2", stable_prices, start=start)
-        await _insert_price(migrated_pool, "tok_mr2", 0.10, ts=now)
+        await _insert_baseline_with_spike(
+            migrated_pool, "tok_mr2", 0.70, 0.10, datetime.now(timezone.utc)
+        )
 
         signals = await generate_mean_reversion_signals(
             migrated_pool, z_threshold=2.0, lookback_hours=6
@@ -314,12 +337,10 @@ class TestGetAllSignals:
         self, migrated_pool: asyncpg.Pool
     ) -> None:
         """Duplicate signals for the same (token, type) are merged."""
-        now = datetime.now(timezone.utc)
-        start = now - timedelta(hours=3)
-
         # Create a mean-reversion signal for tok_dedup
-        await _insert_prices_bulk(migrated_pool, "tok_dedup", [0.50] * 100, start=start)
-        await _insert_price(migrated_pool, "tok_dedup", 0.95, ts=now)
+        await _insert_baseline_with_spike(
+            migrated_pool, "tok_dedup", 0.50, 0.95, datetime.now(timezone.utc)
+        )
 
         signals = await get_all_signals(migrated_pool)
 
@@ -334,12 +355,10 @@ class TestGetAllSignals:
         self, migrated_pool: asyncpg.Pool
     ) -> None:
         """Returned signals are sorted strongest-first."""
-        now = datetime.now(timezone.utc)
-        start = now - timedelta(hours=3)
-
         # Create multiple signals with different strengths
-        await _insert_prices_bulk(migrated_pool, "tok_rank1", [0.50] * 100, start=start)
-        await _insert_price(migrated_pool, "tok_rank1", 0.95, ts=now)
+        await _insert_baseline_with_spike(
+            migrated_pool, "tok_rank1", 0.50, 0.95, datetime.now(timezone.utc)
+        )
 
         await _insert_orderbook(migrated_pool, "tok_rank2", spread=0.10, midpoint=0.50)
 
@@ -360,11 +379,9 @@ class TestGetAllSignals:
         self, migrated_pool: asyncpg.Pool
     ) -> None:
         """Every signal has valid field values."""
-        now = datetime.now(timezone.utc)
-        start = now - timedelta(hours=3)
-
-        await _insert_prices_bulk(migrated_pool, "tok_valid", [0.50] * 100, start=start)
-        await _insert_price(migrated_pool, "tok_valid", 0.95, ts=now)
+        await _insert_baseline_with_spike(
+            migrated_pool, "tok_valid", 0.50, 0.95, datetime.now(timezone.utc)
+        )
 
         signals = await get_all_signals(migrated_pool)
 
@@ -1,78 +1,34 @@
 """Shared fixtures for collector integration tests.
 
 Provides:
-- ``mock_client``: PolymarketClient with default config (respx intercepts HTTP).
-- ``migrated_pool``: asyncpg pool with full schema applied (re-used from db tests).
+- ``mock_client``: session-wide PolymarketClient with default config (for
+  tests that intercept HTTP with respx; the metadata tests build their own
+  clients on an ``httpx.MockTransport`` instead).
+- ``migrated_pool``: asyncpg pool with full schema applied (re-exported from
+  tests/db/conftest.py).  Migrations run once per test class; each test
+  starts from empty tables.
 """
 
-import asyncio
-from pathlib import Path
+from typing import AsyncGenerator
 
-import asyncpg
 import pytest
 
-from src.db.migrations.runner import run_migrations
 from src.utils.client import PolymarketClient
+from tests.db.conftest import _migrated_schema, migrated_pool
 
-MIGRATIONS_DIR = Path(__file__).resolve().parents[2] / "src" / "db" / "migrations"
+__all__ = ["_migrated_schema", "migrated_pool", "mock_client"]
 
 
-async def _drop_with_retry(
-    conn: asyncpg.Connection, sql: str, max_retries: int = 3, delay: float = 0.5
-) -> None:
-    """Execute a DROP statement with retries for TimescaleDB deadlocks."""
-    for attempt in range(max_retries):
-        try:
-            await conn.execute(sql)
-            return
-        except asyncpg.DeadlockDetectedError:
-            if attempt == max_retries - 1:
-                raise
-            await asyncio.sleep(delay * (attempt + 1))
+@pytest.fixture(scope="session")
+async def mock_client() -> AsyncGenerator[PolymarketClient, None]:
+    """Create one PolymarketClient with default config for the session.
 
-
-@pytest.fixture
-async def migrated_pool(db_pool: asyncpg.Pool) -> asyncpg.Pool:
-    """Run all migrations and return the pool with full schema.
-
-    Mirrors the fixture in tests/db/conftest.py so that collector
-    integration tests have access to the same migrated database.
-    """
-    async with db_pool.acquire() as conn:
-        await _drop_with_retry(
-            conn, "DROP TABLE IF EXISTS schema_migrations CASCADE;"
-        )
-        await _drop_with_retry(
-            conn,
-            "DROP MATERIALIZED VIEW IF EXISTS price_candles_1h CASCADE;",
-        )
-        await _drop_with_retry(
-            conn,
-            "DROP MATERIALIZED VIEW IF EXISTS trade_volume_1h CASCADE;",
-        )
-        for table in [
-            "price_snapshots",
-            "orderbook_snapshots",
-            "trades",
-            "markets",
-            "resolutions",
-        ]:
-            await _drop_with_retry(
-                conn, f"DROP TABLE IF EXISTS {table} CASCADE;"
-            )
-
-    applied = await run_migrations(db_pool, MIGRATIONS_DIR)
-    assert len(applied) == 8, f"Expected 8 migrations, got {len(applied)}: {applied}"
-
-    return db_pool
-
-
-@pytest.fixture
-def mock_client() -> PolymarketClient:
-    """Create a PolymarketClient with default config for testing.
-
-    Tests that need to mock HTTP responses should use ``@respx.mock``
-    or ``respx.mock()`` context manager — respx intercepts the
-    underlying ``httpx.AsyncClient`` used by the client.
+    The client is stateless between tests, so its ``httpx.AsyncClient``
+    is built once and closed at session end.  Tests that need to mock
+    HTTP responses should use ``@respx.mock`` or ``respx.mock()`` context
+    manager — respx intercepts the underlying ``httpx.AsyncClient`` used
+    by the client.
     """
-    return PolymarketClient()
+    client = PolymarketClient()
+    yield client
+    await client.close()
@@ -9,6 +9,7 @@ Uses unittest.mock to patch all 5 collector constructors so that
 """
 
 import asyncio
+import itertools
 import logging
 from dataclasses import dataclass
 from unittest import mock
@@ -21,23 +22,37 @@ from src.collector.daemon import CollectorDaemon
 from src.collector.trade_listener import TradeListenerHealth
 from src.config import CollectorConfig
 
+# Module-wide hang guard (pytest-timeout) instead of per-await wait_for.
+pytestmark = pytest.mark.timeout(5)
+
+# Task slots created by CollectorDaemon.run(), and the subset stop()
+# cancels directly (the trades task is stopped via TradeListener.stop()).
+_TASK_SLOTS = frozenset({
+    "metadata", "prices", "orderbooks", "resolutions",
+    "trades", "_monitor", "_health",
+})
+_CANCELABLE_SLOTS = (
+    "metadata", "prices", "orderbooks", "resolutions",
+    "_monitor", "_health",
+)
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _mock_trade_listener_health() -> TradeListenerHealth:
-    """Return a TradeListenerHealth with plausible test values."""
-    health = TradeListenerHealth()
-    health.trades_received = 42
-    health.trades_inserted = 40
-    health.connections_active = 2
-    health.queue_depth = 3
-    return health
+# TradeListenerHealth with plausible test values.  Tests only read it, so
+# one shared instance serves every mocked TradeListener.
+_TRADE_HEALTH_SENTINEL = TradeListenerHealth(
+    trades_received=42,
+    trades_inserted=40,
+    connections_active=2,
+    queue_depth=3,
+)
 
 
 def _make_collector_patches():
-    """Return a dict of 5 mock.patch context managers for all collectors.
+    """Return a dict of 5 mock collector classes keyed by attribute name.
 
     Each patch replaces the collector *class* inside ``src.collector.daemon``
     with a MagicMock whose return_value is an AsyncMock.  Calling the class
@@ -62,30 +77,98 @@ def _make_collector_patches():
     tl_instance = AsyncMock()
     tl_instance.run = AsyncMock()
     tl_instance.stop = AsyncMock()
-    tl_instance.get_health = MagicMock(return_value=_mock_trade_listener_health())
+    tl_instance.get_health = MagicMock(return_value=_TRADE_HEALTH_SENTINEL)
     tl.return_value = tl_instance
     patches["TradeListener"] = tl
 
     return patches
 
 
+@dataclass(slots=True)
+class FakeTask:
+    """Minimal stand-in for ``asyncio.Task`` as inspected by the daemon."""
+
+    is_done: bool = False
+    is_cancelled: bool = False
+    exc: BaseException | None = None
+    cancel_count: int = 0
+
+    def done(self) -> bool:
+        return self.is_done
+
+    def cancelled(self) -> bool:
+        return self.is_cancelled
+
+    def exception(self) -> BaseException | None:
+        return self.exc
+
+    def cancel(self) -> bool:
+        self.cancel_count += 1
+        return True
+
+
+def _stop_after(daemon: CollectorDaemon, calls: int, result=None):
+    """Return a mock ``side_effect`` that stops the daemon after ``calls`` calls.
+
+    Each call returns ``result`` (or raises it, if it is an exception); the
+    ``calls``-th call also sets ``daemon._running = False`` so the loop
+    under test exits deterministically without any real waiting.
+    """
+    counter = itertools.count(1)
+
+    def side_effect(*args, **kwargs):
+        if next(counter) >= calls:
+            daemon._running = False
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    return side_effect
+
+
+def _stop_when(daemon: CollectorDaemon, condition):
+    """Return a sleep ``side_effect`` that stops the daemon once ``condition()`` holds.
+
+    Lets monitor tests end on the outcome they wait for (e.g. a restart
+    being recorded) instead of on how many times ``_monitor_tasks`` sleeps.
+    """
+
+    def side_effect(*args, **kwargs):
+        if condition():
+            daemon._running = False
+
+    return side_effect
+
+
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def fast_sleep(monkeypatch):
+    """Virtual clock: every ``asyncio.sleep`` returns immediately.
+
+    Loops under test are stopped by ``_stop_after`` / ``_stop_when`` side
+    effects rather than by wall-clock delays.
+    """
+    sleep = AsyncMock(return_value=None)
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+    return sleep
+
+
+@pytest.fixture(scope="module")
 def mock_pool():
     """asyncpg.Pool mock -- never actually used by mocked collectors."""
     return AsyncMock(spec=asyncpg.Pool)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_client():
     """PolymarketClient mock."""
     return MagicMock()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_config():
     """CollectorConfig with short intervals for fast tests."""
     return CollectorConfig(
@@ -97,24 +180,29 @@ def mock_config():
         max_markets=10,
         ws_ping_interval_sec=1,
         ws_max_instruments_per_conn=50,
-        trade_batch_drain_timeout_sec=1.0,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def collector_patches():
-    """Apply all 5 collector patches and yield the mock classes."""
+    """Apply all 5 collector patches once per module and yield the mock classes.
+
+    The mock graph is built once; ``_reset_collector_mocks`` clears call
+    records and any per-test ``side_effect`` after every test.
+    """
     mocks = _make_collector_patches()
-    with (
-        patch("src.collector.daemon.MarketMetadataCollector", mocks["MarketMetadataCollector"]),
-        patch("src.collector.daemon.PriceSnapshotCollector", mocks["PriceSnapshotCollector"]),
-        patch("src.collector.daemon.OrderbookSnapshotCollector", mocks["OrderbookSnapshotCollector"]),
-        patch("src.collector.daemon.ResolutionTracker", mocks["ResolutionTracker"]),
-        patch("src.collector.daemon.TradeListener", mocks["TradeListener"]),
-    ):
+    with patch.multiple("src.collector.daemon", **mocks):
         yield mocks
 
 
+@pytest.fixture(autouse=True)
+def _reset_collector_mocks(collector_patches):
+    """Reset the shared collector mocks after each test."""
+    yield
+    for m in collector_patches.values():
+        m.reset_mock(return_value=False, side_effect=True)
+
+
 @pytest.fixture
 def daemon(mock_pool, mock_client, mock_config, collector_patches):
     """CollectorDaemon with all collectors mocked."""
@@ -163,14 +251,10 @@ class TestDaemonRun:
         # Set the shutdown event immediately so run() does not block
         daemon._shutdown_event.set()
 
-        await asyncio.wait_for(daemon.run(), timeout=5.0)
+        await daemon.run()
 
         # After run() completes, _tasks should have 7 entries
-        expected_keys = {
-            "metadata", "prices", "orderbooks", "resolutions",
-            "trades", "_monitor", "_health",
-        }
-        assert set(daemon._tasks.keys()) == expected_keys
+        assert daemon._tasks.keys() == _TASK_SLOTS
 
 
 class TestDaemonStop:
@@ -181,27 +265,19 @@ class TestDaemonStop:
         daemon._running = True
 
         # Create mock tasks for each slot
-        cancel_names = [
-            "metadata", "prices", "orderbooks", "resolutions",
-            "_monitor", "_health",
-        ]
-        for name in cancel_names:
-            task = MagicMock()
-            task.done.return_value = False
-            daemon._tasks[name] = task
+        for name in _CANCELABLE_SLOTS:
+            daemon._tasks[name] = FakeTask()
 
         # Trades task -- should NOT be cancelled directly, stop() is used
-        trades_task = MagicMock()
-        trades_task.done.return_value = False
-        daemon._tasks["trades"] = trades_task
+        daemon._tasks["trades"] = FakeTask()
 
         # Make gather a no-op (tasks are mocks, not real asyncio.Tasks)
         with patch("asyncio.gather", new_callable=AsyncMock):
-            await asyncio.wait_for(daemon.stop(), timeout=5.0)
+            await daemon.stop()
 
         # Polling tasks should have cancel() called
-        for name in cancel_names:
-            daemon._tasks[name].cancel.assert_called_once()
+        for name in _CANCELABLE_SLOTS:
+            assert daemon._tasks[name].cancel_count == 1
 
         # TradeListener.stop() should have been awaited
         daemon._trade_listener.stop.assert_awaited_once()
@@ -213,16 +289,13 @@ class TestDaemonStop:
         """Calling stop() twice does not raise."""
         daemon._running = True
 
-        for name in ["metadata", "prices", "orderbooks", "resolutions",
-                      "_monitor", "_health", "trades"]:
-            task = MagicMock()
-            task.done.return_value = False
-            daemon._tasks[name] = task
+        for name in _TASK_SLOTS:
+            daemon._tasks[name] = FakeTask()
 
         with patch("asyncio.gather", new_callable=AsyncMock):
-            await asyncio.wait_for(daemon.stop(), timeout=5.0)
+            await daemon.stop()
             # Second call should be a no-op (returns immediately)
-            await asyncio.wait_for(daemon.stop(), timeout=5.0)
+            await daemon.stop()
 
         assert daemon._running is False
 
@@ -233,21 +306,12 @@ class TestPollingLoop:
     async def test_polling_loop_calls_collect_once(self, daemon):
         """_run_polling_loop calls collector.collect_once() at least once."""
         collector = AsyncMock()
-        collector.collect_once = AsyncMock(return_value=10)
+        collector.collect_once = AsyncMock(
+            side_effect=_stop_after(daemon, 2, 10)
+        )
         daemon._running = True
 
-        async def stop_after_delay():
-            await asyncio.sleep(0.05)
-            daemon._running = False
-
-        loop_task = asyncio.create_task(
-            daemon._run_polling_loop("test_coll", collector, 0)
-        )
-        stop_task = asyncio.create_task(stop_after_delay())
-
-        await asyncio.wait_for(
-            asyncio.gather(loop_task, stop_task), timeout=5.0
-        )
+        await daemon._run_polling_loop("test_coll", collector, 0)
 
         assert collector.collect_once.await_count >= 1
 
@@ -255,23 +319,12 @@ class TestPollingLoop:
         """_run_polling_loop continues after collect_once raises."""
         collector = AsyncMock()
         collector.collect_once = AsyncMock(
-            side_effect=RuntimeError("boom")
+            side_effect=_stop_after(daemon, 3, RuntimeError("boom"))
         )
         daemon._running = True
 
-        async def stop_after_delay():
-            await asyncio.sleep(0.1)
-            daemon._running = False
-
         with caplog.at_level(logging.ERROR):
-            loop_task = asyncio.create_task(
-                daemon._run_polling_loop("test_coll", collector, 0)
-            )
-            stop_task = asyncio.create_task(stop_after_delay())
-
-            await asyncio.wait_for(
-                asyncio.gather(loop_task, stop_task), timeout=5.0
-            )
+            await daemon._run_polling_loop("test_coll", collector, 0)
 
         # Should have been called multiple times despite errors
         assert collector.collect_once.await_count >= 2
@@ -287,36 +340,23 @@ class TestPollingLoop:
 class TestMonitorCrashRecovery:
     """Tests for CollectorDaemon._monitor_tasks crash recovery."""
 
-    async def test_monitor_detects_crashed_task(self, daemon):
+    async def test_monitor_detects_crashed_task(self, daemon, fast_sleep):
         """Crashed polling task gets restarted and _restart_counts incremented."""
         daemon._running = True
 
         # Create a task that is "done" with an exception (simulates crash)
-        crashed_task = MagicMock()
-        crashed_task.done.return_value = True
-        crashed_task.cancelled.return_value = False
-        crashed_task.exception.return_value = RuntimeError("boom")
+        crashed_task = FakeTask(is_done=True, exc=RuntimeError("boom"))
         daemon._tasks["metadata"] = crashed_task
 
         # _monitor also monitors itself -- add a stub for it
-        monitor_stub = MagicMock()
-        monitor_stub.done.return_value = False
-        daemon._tasks["_monitor"] = monitor_stub
+        daemon._tasks["_monitor"] = FakeTask()
 
-        # Patch asyncio.sleep to skip actual delays, and stop after first iteration
-        call_count = 0
-        original_running = True
-
-        async def fake_sleep(secs):
-            nonlocal call_count
-            call_count += 1
-            # First sleep is the 10s monitor interval, second is the restart delay
-            # After the restart delay, stop the loop
-            if call_count >= 3:
-                daemon._running = False
+        # Stop at the first sleep after the restart has been recorded
+        fast_sleep.side_effect = _stop_when(
+            daemon, lambda: "metadata" in daemon._restart_counts
+        )
 
-        with patch("asyncio.sleep", side_effect=fake_sleep):
-            await asyncio.wait_for(daemon._monitor_tasks(), timeout=5.0)
+        await daemon._monitor_tasks()
 
         # Restart count should be incremented
         assert daemon._restart_counts.get("metadata", 0) == 1
@@ -336,36 +376,24 @@ class TestMonitorCrashRecovery:
                 f"restart_count={count}: expected {expected_delay}, got {actual}"
             )
 
-    async def test_monitor_max_restarts_gives_up(self, daemon, caplog):
+    async def test_monitor_max_restarts_gives_up(
+        self, daemon, caplog, fast_sleep
+    ):
         """At max restarts, task is NOT recreated and CRITICAL log is emitted."""
         daemon._running = True
         daemon._restart_counts["metadata"] = 5  # At max (default _max_restarts=5)
 
         # Create crashed task
-        crashed_task = MagicMock()
-        crashed_task.done.return_value = True
-        crashed_task.cancelled.return_value = False
-        crashed_task.exception.return_value = RuntimeError("boom")
+        crashed_task = FakeTask(is_done=True, exc=RuntimeError("boom"))
         daemon._tasks["metadata"] = crashed_task
 
-        monitor_stub = MagicMock()
-        monitor_stub.done.return_value = False
-        daemon._tasks["_monitor"] = monitor_stub
-
-        # One iteration then stop
-        call_count = 0
+        daemon._tasks["_monitor"] = FakeTask()
 
-        async def fake_sleep(secs):
-            nonlocal call_count
-            call_count += 1
-            if call_count >= 1:
-                daemon._running = False
+        # Stop at the first sleep; the sweep in flight still completes
+        fast_sleep.side_effect = _stop_when(daemon, lambda: True)
 
-        with (
-            patch("asyncio.sleep", side_effect=fake_sleep),
-            caplog.at_level(logging.CRITICAL),
-        ):
-            await asyncio.wait_for(daemon._monitor_tasks(), timeout=5.0)
+        with caplog.at_level(logging.CRITICAL):
+            await daemon._monitor_tasks()
 
         # Task should NOT have been replaced
         assert daemon._tasks["metadata"] is crashed_task
@@ -377,21 +405,19 @@ class TestMonitorCrashRecovery:
         daemon._running = False
 
         # Add a crashed task -- should NOT be restarted
-        crashed_task = MagicMock()
-        crashed_task.done.return_value = True
-        crashed_task.cancelled.return_value = False
-        crashed_task.exception.return_value = RuntimeError("boom")
+        crashed_task = FakeTask(is_done=True, exc=RuntimeError("boom"))
         daemon._tasks["metadata"] = crashed_task
 
         # _monitor_tasks checks self._running in while loop; should exit immediately
-        await asyncio.wait_for(daemon._monitor_tasks(), timeout=5.0)
+        await daemon._monitor_tasks()
 
         # Task should still be the same crashed one (no restart attempted)
         assert daemon._tasks["metadata"] is crashed_task
         assert daemon._restart_counts.get("metadata", 0) == 0
 
     async def test_trade_listener_restart_creates_new_instance(
-        self, mock_pool, mock_client, mock_config, collector_patches
+        self, mock_pool, mock_client, mock_config, collector_patches,
+        fast_sleep,
     ):
         """Crashed trades task re-instantiates TradeListener with fresh state."""
         # Make TradeListener constructor return a NEW mock each time
@@ -401,7 +427,7 @@ class TestMonitorCrashRecovery:
             inst = AsyncMock()
             inst.run = AsyncMock()
             inst.stop = AsyncMock()
-            inst.get_health = MagicMock(return_value=_mock_trade_listener_health())
+            inst.get_health = MagicMock(return_value=_TRADE_HEALTH_SENTINEL)
             tl_instances.append(inst)
             return inst
 
@@ -413,26 +439,16 @@ class TestMonitorCrashRecovery:
         original_listener = daemon._trade_listener
 
         # Create crashed trades task
-        crashed_task = MagicMock()
-        crashed_task.done.return_value = True
-        crashed_task.cancelled.return_value = False
-        crashed_task.exception.return_value = RuntimeError("ws error")
+        crashed_task = FakeTask(is_done=True, exc=RuntimeError("ws error"))
         daemon._tasks["trades"] = crashed_task
 
-        monitor_stub = MagicMock()
-        monitor_stub.done.return_value = False
-        daemon._tasks["_monitor"] = monitor_stub
+        daemon._tasks["_monitor"] = FakeTask()
 
-        call_count = 0
-
-        async def fake_sleep(secs):
-            nonlocal call_count
-            call_count += 1
-            if call_count >= 3:
-                daemon._running = False
+        fast_sleep.side_effect = _stop_when(
+            daemon, lambda: "trades" in daemon._restart_counts
+        )
 
-        with patch("asyncio.sleep", side_effect=fake_sleep):
-            await asyncio.wait_for(daemon._monitor_tasks(), timeout=5.0)
+        await daemon._monitor_tasks()
 
         # TradeListener should be a NEW instance (2 total created)
         assert len(tl_instances) == 2
@@ -454,12 +470,8 @@ class TestHealthLogging:
         """get_health() returns dict with all expected keys and types."""
         daemon._running = True
         # Need real tasks for alive/dead counting
-        alive_task = MagicMock()
-        alive_task.done.return_value = False
-        dead_task = MagicMock()
-        dead_task.done.return_value = True
-        daemon._tasks["metadata"] = alive_task
-        daemon._tasks["dead_one"] = dead_task
+        daemon._tasks["metadata"] = FakeTask()
+        daemon._tasks["dead_one"] = FakeTask(is_done=True)
         daemon._restart_counts["metadata"] = 2
 
         from datetime import datetime, timezone
@@ -487,7 +499,9 @@ class TestHealthLogging:
     async def test_collector_stats_updated_by_polling_loop(self, daemon):
         """Polling loop updates _collector_stats with items and timestamps."""
         collector = AsyncMock()
-        collector.collect_once = AsyncMock(return_value=10)
+        collector.collect_once = AsyncMock(
+            side_effect=_stop_after(daemon, 2, 10)
+        )
         daemon._running = True
 
         # Initialize stats for our test collector
@@ -498,18 +512,7 @@ class TestHealthLogging:
             "last_error": None,
         }
 
-        async def stop_after_delay():
-            await asyncio.sleep(0.05)
-            daemon._running = False
-
-        loop_task = asyncio.create_task(
-            daemon._run_polling_loop("test_coll", collector, 0)
-        )
-        stop_task = asyncio.create_task(stop_after_delay())
-
-        await asyncio.wait_for(
-            asyncio.gather(loop_task, stop_task), timeout=5.0
-        )
+        await daemon._run_polling_loop("test_coll", collector, 0)
 
         stats = daemon._collector_stats["test_coll"]
         assert stats["total_items"] >= 10
@@ -521,7 +524,7 @@ class TestHealthLogging:
         """Polling loop updates _collector_stats with error info on failure."""
         collector = AsyncMock()
         collector.collect_once = AsyncMock(
-            side_effect=ValueError("bad data")
+            side_effect=_stop_after(daemon, 2, ValueError("bad data"))
         )
         daemon._running = True
 
@@ -533,18 +536,7 @@ class TestHealthLogging:
             "last_error": None,
         }
 
-        async def stop_after_delay():
-            await asyncio.sleep(0.05)
-            daemon._running = False
-
-        loop_task = asyncio.create_task(
-            daemon._run_polling_loop("err_coll", collector, 0)
-        )
-        stop_task = asyncio.create_task(stop_after_delay())
-
-        await asyncio.wait_for(
-            asyncio.gather(loop_task, stop_task), timeout=5.0
-        )
+        await daemon._run_polling_loop("err_coll", collector, 0)
 
         stats = daemon._collector_stats["err_coll"]
         assert stats["error_count"] >= 1
@@ -1,49 +1,62 @@
 """Tests for MarketMetadataCollector.
 
 Unit tests verify field extraction logic without DB or HTTP.
-Integration tests use respx to mock the Gamma API and migrated_pool
-for real database writes.
+Integration tests serve Gamma API pages from an ``httpx.MockTransport``
+and use migrated_pool for real database writes; the pagination tests use
+the MockTransport alone.
 """
 
+import asyncio
+from typing import AsyncGenerator, Callable
+
 import httpx
+import orjson
 import pytest
-import respx
 
 from src.collector.market_metadata import MarketMetadataCollector
 from src.config import CollectorConfig
 from src.db.queries.markets import get_market
 from src.utils.client import PolymarketClient
 
-GAMMA_EVENTS_URL = "https://gamma-api.polymarket.com/events"
+
+# Shared across tests: the defaults are never mutated, and the client's
+# HTTP session is only created if a test actually makes a request.
+_DEFAULT_CONFIG = CollectorConfig()
+_DEFAULT_CLIENT = PolymarketClient()
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+# Gamma API market fields shared by every sample market
+_TEMPLATE_MARKET = {
+    "slug": "will-x-happen",
+    "clobTokenIds": '["token_yes","token_no"]',
+    "outcomePrices": '["0.55","0.45"]',
+    "outcomes": '["Yes","No"]',
+    "active": True,
+    "closed": False,
+    "endDateIso": "2026-03-01T00:00:00Z",
+    "marketType": "binary",
+}
+
+
 def _make_raw_market(
     condition_id: str = "0xabc123",
     question: str = "Will X happen?",
-    slug: str = "will-x-happen",
-    clob_token_ids: str = '["token_yes","token_no"]',
-    outcomes: str = '["Yes","No"]',
-    active: bool = True,
-    closed: bool = False,
-    end_date_iso: str = "2026-03-01T00:00:00Z",
-    market_type: str = "binary",
+    **overrides,
 ) -> dict:
-    """Build a sample Gamma API market dict."""
+    """Build a sample Gamma API market dict.
+
+    Copies ``_TEMPLATE_MARKET``; ``overrides`` replace fields by their
+    Gamma API key (e.g. ``outcomes=["Yes", "No"]``).
+    """
     return {
+        **_TEMPLATE_MARKET,
         "conditionId": condition_id,
         "question": question,
-        "slug": slug,
-        "clobTokenIds": clob_token_ids,
-        "outcomePrices": '["0.55","0.45"]',
-        "outcomes": outcomes,
-        "active": active,
-        "closed": closed,
-        "endDateIso": end_date_iso,
-        "marketType": market_type,
+        **overrides,
     }
 
 
@@ -52,17 +65,39 @@ def _make_event(markets: list[dict], event_id: str = "evt_1") -> dict:
     return {"id": event_id, "markets": markets}
 
 
+@pytest.fixture
+async def gamma_client() -> AsyncGenerator[
+    Callable[..., PolymarketClient], None
+]:
+    """Factory for clients whose Gamma requests are answered by a handler.
+
+    Each client opens its own HTTP/2 session, so every client the test
+    built is closed at teardown.
+    """
+    clients: list[PolymarketClient] = []
+
+    def make(handler) -> PolymarketClient:
+        client = PolymarketClient(transport=httpx.MockTransport(handler))
+        clients.append(client)
+        return client
+
+    yield make
+
+    for client in clients:
+        await client.close()
+
+
 def _collector(pool=None, client=None) -> MarketMetadataCollector:
     """Create a collector with optional pool/client overrides."""
     return MarketMetadataCollector(
         pool=pool,
-        client=client or PolymarketClient(),
-        config=CollectorConfig(),
+        client=client or _DEFAULT_CLIENT,
+        config=_DEFAULT_CONFIG,
     )
 
 
 # =========================================================================
-# Unit tests — no DB, no respx needed
+# Unit tests — no DB, no HTTP needed
 # =========================================================================
 
 
@@ -114,7 +149,7 @@ class TestExtractMarketData:
     def test_extract_market_data_native_list_clob_token_ids(self) -> None:
         """clobTokenIds as native Python list works."""
         collector = _collector()
-        raw = _make_raw_market(clob_token_ids=["tok_a", "tok_b"])
+        raw = _make_raw_market(clobTokenIds=["tok_a", "tok_b"])
 
         result = collector._extract_market_data(raw)
 
@@ -205,16 +240,15 @@ class TestExtractMarketsFromEvents:
 
 
 # =========================================================================
-# Integration tests — respx + migrated_pool
+# Integration tests — MockTransport + migrated_pool
 # =========================================================================
 
 
 class TestCollectOnce:
     """Integration tests for the full collect_once flow."""
 
-    @respx.mock
     async def test_collect_once_success(
-        self, migrated_pool, mock_client
+        self, migrated_pool, gamma_client
     ) -> None:
         """collect_once fetches events, extracts markets, and upserts to DB."""
         events = [
@@ -228,14 +262,12 @@ class TestCollectOnce:
         ]
 
         # Mock: single page with < 100 events → no pagination
-        respx.get(GAMMA_EVENTS_URL).mock(
-            return_value=httpx.Response(200, json=events)
-        )
+        client = gamma_client(lambda request: httpx.Response(200, json=events))
 
         collector = MarketMetadataCollector(
             pool=migrated_pool,
-            client=mock_client,
-            config=CollectorConfig(),
+            client=client,
+            config=_DEFAULT_CONFIG,
         )
         count = await collector.collect_once()
 
@@ -250,9 +282,8 @@ class TestCollectOnce:
         assert m3 is not None
         assert m3.question == "Q3?"
 
-    @respx.mock
     async def test_collect_once_pagination(
-        self, migrated_pool, mock_client
+        self, migrated_pool, gamma_client
     ) -> None:
         """collect_once handles multi-page pagination correctly."""
         # Page 1: exactly 100 events (triggers pagination), each with 1 market
@@ -273,21 +304,25 @@ class TestCollectOnce:
             for i in range(20)
         ]
 
+        # Encoded page bodies keyed by offset, serialized once up front;
+        # any other offset is past the end
+        pages_by_offset = {
+            0: orjson.dumps(page_1_events),
+            100: orjson.dumps(page_2_events),
+        }
+
         def gamma_side_effect(request):
             offset = int(request.url.params.get("offset", 0))
-            if offset == 0:
-                return httpx.Response(200, json=page_1_events)
-            elif offset == 100:
-                return httpx.Response(200, json=page_2_events)
-            else:
-                return httpx.Response(200, json=[])
-
-        respx.get(GAMMA_EVENTS_URL).mock(side_effect=gamma_side_effect)
+            return httpx.Response(
+                200,
+                content=pages_by_offset.get(offset, b"[]"),
+                headers={"content-type": "application/json"},
+            )
 
         collector = MarketMetadataCollector(
             pool=migrated_pool,
-            client=mock_client,
-            config=CollectorConfig(),
+            client=gamma_client(gamma_side_effect),
+            config=_DEFAULT_CONFIG,
         )
         count = await collector.collect_once()
 
@@ -303,21 +338,104 @@ class TestCollectOnce:
         assert m_p2 is not None
         assert m_p2.question == "P2 Q10?"
 
-    @respx.mock
-    async def test_collect_once_api_error(
-        self, mock_client
-    ) -> None:
+    async def test_collect_once_api_error(self, gamma_client) -> None:
         """collect_once returns 0 and does not raise on API error."""
-        respx.get(GAMMA_EVENTS_URL).mock(
-            return_value=httpx.Response(500)
-        )
+        client = gamma_client(lambda request: httpx.Response(500))
 
         # pool=None is fine — we should never reach DB code on error
         collector = MarketMetadataCollector(
             pool=None,
-            client=mock_client,
-            config=CollectorConfig(),
+            client=client,
+            config=_DEFAULT_CONFIG,
         )
         count = await collector.collect_once()
 
         assert count == 0
+
+
+class TestIterActiveEventPages:
+    """Concurrent Gamma pagination: truncation, early stop, page order."""
+
+    @staticmethod
+    def _pages(sizes: dict[int, int], requested: list[int], delays=None):
+        """Handler serving ``sizes[offset]`` events per page.
+
+        Records each requested offset in ``requested``; ``delays`` maps an
+        offset to seconds to wait before answering.  Event ids are the
+        event's absolute index, so order is easy to check.
+        """
+        delays = delays or {}
+
+        async def handler(request):
+            offset = int(request.url.params.get("offset", 0))
+            requested.append(offset)
+            await asyncio.sleep(delays.get(offset, 0))
+            events = [
+                _make_event([], event_id=str(offset + i))
+                for i in range(sizes.get(offset, 0))
+            ]
+            return httpx.Response(200, json=events)
+
+        return handler
+
+    @pytest.mark.parametrize(
+        ("max_events", "expected_offsets", "expected_sizes"),
+        [
+            pytest.param(50, [0], [50], id="first_page"),
+            pytest.param(150, [0, 100], [100, 50], id="second_page"),
+            pytest.param(250, [0, 100, 200], [100, 100, 50], id="next_round"),
+        ],
+    )
+    async def test_max_events_ends_mid_page(
+        self,
+        gamma_client,
+        max_events: int,
+        expected_offsets: list[int],
+        expected_sizes: list[int],
+    ) -> None:
+        """The last page is cut to ``remaining`` and nothing past it is fetched."""
+        requested: list[int] = []
+        client = gamma_client(
+            self._pages({0: 100, 100: 100, 200: 100, 300: 100}, requested)
+        )
+
+        pages = [
+            page async for page in
+            client.iter_active_event_pages(max_events=max_events)
+        ]
+
+        assert [len(page) for page in pages] == expected_sizes
+        assert sum(expected_sizes) == max_events
+        assert sorted(requested) == expected_offsets
+
+    @pytest.mark.parametrize("first_size", [0, 30], ids=["empty", "short"])
+    async def test_short_first_page_stops_round(
+        self, gamma_client, first_size: int
+    ) -> None:
+        """A short or empty page ends pagination; the later page is dropped."""
+        requested: list[int] = []
+        client = gamma_client(self._pages({0: first_size, 100: 100}, requested))
+
+        pages = [page async for page in client.iter_active_event_pages()]
+
+        assert [len(page) for page in pages] == ([first_size] if first_size else [])
+        assert sorted(requested) == [0, 100]
+
+    async def test_pages_yielded_in_offset_order(self, gamma_client) -> None:
+        """Pages come back in offset order even when a later one answers first."""
+        requested: list[int] = []
+        client = gamma_client(
+            self._pages(
+                {0: 100, 100: 100, 200: 10},
+                requested,
+                delays={0: 0.05},
+            )
+        )
+
+        pages = [page async for page in client.iter_active_event_pages()]
+
+        # offset 100 was answered before offset 0 but still yields second
+        assert [page[0]["id"] for page in pages] == ["0", "100", "200"]
+        assert [event["id"] for page in pages for event in page] == [
+            str(i) for i in range(210)
+        ]
@@ -16,6 +16,10 @@ from src.db.queries.markets import upsert_market
 from src.db.queries.orderbooks import get_latest_orderbook
 
 
+# Shared across tests; the defaults are never mutated.
+_DEFAULT_CONFIG = CollectorConfig()
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -26,7 +30,7 @@ def _collector(pool=None, client=None) -> OrderbookSnapshotCollector:
     return OrderbookSnapshotCollector(
         pool=pool,
         client=client,
-        config=CollectorConfig(),
+        config=_DEFAULT_CONFIG,
     )
 
 
@@ -49,6 +53,11 @@ def _make_book(
     }
 
 
+# One-level book reused for every token in bulk-fetch mocks; the collector
+# only reads books, so sharing a single dict is safe.
+_SHARED_BOOK = _make_book(bids=[("0.50", "100")], asks=[("0.51", "100")])
+
+
 async def _insert_active_market(
     pool, condition_id: str, token_ids: list[str]
 ) -> None:
@@ -231,13 +240,7 @@ class TestCollectOnce:
         mock_fetch = AsyncMock()
 
         def fetch_side_effect(token_ids):
-            return [
-                _make_book(
-                    bids=[("0.50", "100")],
-                    asks=[("0.51", "100")],
-                )
-                for _ in token_ids
-            ]
+            return [_SHARED_BOOK] * len(token_ids)
 
         mock_fetch.side_effect = fetch_side_effect
 
@@ -254,3 +257,36 @@ class TestCollectOnce:
 
         # All 50 tokens should be inserted
         assert count == 50
+
+    async def test_later_chunk_failure_keeps_earlier_rows(
+        self, migrated_pool
+    ) -> None:
+        """A malformed book in chunk 2 doesn't drop chunk 1's insert."""
+        for i in range(25):
+            await _insert_active_market(
+                migrated_pool,
+                f"0xob_fail_{i}",
+                [f"tok_fail_{i}_yes", f"tok_fail_{i}_no"],
+            )
+
+        collector = _collector(pool=migrated_pool)
+        bad_book = _make_book(bids=[("not-a-price", "100")])
+
+        mock_fetch = AsyncMock()
+        mock_fetch.side_effect = [
+            [_SHARED_BOOK] * 20,
+            [bad_book] * 20,
+        ]
+
+        with patch.object(collector, "_fetch_orderbooks", mock_fetch):
+            count = await collector.collect_once()
+
+        assert mock_fetch.call_count == 2
+        assert count == 20
+
+        first_chunk = mock_fetch.call_args_list[0].args[0]
+        rows = await migrated_pool.fetchval(
+            "SELECT count(*) FROM orderbook_snapshots WHERE token_id = ANY($1)",
+            first_chunk,
+        )
+        assert rows == 20
@@ -19,6 +19,12 @@ from src.utils.client import PolymarketClient
 GAMMA_EVENTS_URL = "https://gamma-api.polymarket.com/events"
 
 
+# Shared across tests: the defaults are never mutated, and the client's
+# HTTP session is only created if a test actually makes a request.
+_DEFAULT_CONFIG = CollectorConfig()
+_DEFAULT_CLIENT = PolymarketClient()
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -57,8 +63,8 @@ def _collector(pool=None, client=None) -> PriceSnapshotCollector:
     """Create a collector with optional pool/client overrides."""
     return PriceSnapshotCollector(
         pool=pool,
-        client=client or PolymarketClient(),
-        config=CollectorConfig(),
+        client=client or _DEFAULT_CLIENT,
+        config=_DEFAULT_CONFIG,
     )
 
 
@@ -224,7 +230,7 @@ class TestCollectOnce:
         collector = PriceSnapshotCollector(
             pool=migrated_pool,
             client=mock_client,
-            config=CollectorConfig(),
+            config=_DEFAULT_CONFIG,
         )
         count = await collector.collect_once()
 
@@ -258,7 +264,7 @@ class TestCollectOnce:
         collector = PriceSnapshotCollector(
             pool=migrated_pool,
             client=mock_client,
-            config=CollectorConfig(),
+            config=_DEFAULT_CONFIG,
         )
         count = await collector.collect_once()
 
@@ -292,7 +298,7 @@ class TestCollectOnce:
         collector = PriceSnapshotCollector(
             pool=None,
             client=mock_client,
-            config=CollectorConfig(),
+            config=_DEFAULT_CONFIG,
         )
         count = await collector.collect_once()
 
@@ -1,8 +1,9 @@
 """Tests for WebSocket trade listener parsing and components.
 
 All tests are mock-based (no real WebSocket connections) due to
-geoblocking constraints.  Uses unittest.mock.AsyncMock for WebSocket
-object mocking and pytest-asyncio (auto mode) for async tests.
+geoblocking constraints.  Uses a small ``_FakeWS`` class for WebSocket
+objects, event-driven signalling instead of sleeps, and pytest-asyncio
+(auto mode) for async tests.
 
 03-04 additions: connection pooling, lifecycle management, and health
 state tracking tests.
@@ -10,15 +11,18 @@ state tracking tests.
 
 import asyncio
 import json
+from collections import deque
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from websockets.exceptions import ConnectionClosedOK
 
 from src.collector.trade_listener import (
     TradeListener,
     TradeListenerHealth,
     parse_trade_event,
+    parse_trade_frame,
 )
 from src.config import CollectorConfig
 
@@ -69,7 +73,6 @@ def _make_trade_tuple(
 def _make_listener(
     trade_buffer_size: int = 1000,
     ws_ping_interval_sec: int = 10,
-    trade_batch_drain_timeout_sec: float = 5.0,
     ws_max_instruments_per_conn: int = 500,
     running: bool = True,
 ) -> TradeListener:
@@ -77,7 +80,6 @@ def _make_listener(
     config = CollectorConfig(
         trade_buffer_size=trade_buffer_size,
         ws_ping_interval_sec=ws_ping_interval_sec,
-        trade_batch_drain_timeout_sec=trade_batch_drain_timeout_sec,
         ws_max_instruments_per_conn=ws_max_instruments_per_conn,
     )
     pool = AsyncMock()
@@ -86,6 +88,27 @@ def _make_listener(
     return listener
 
 
+class _FakeWS:
+    """Minimal stand-in for a ``websockets`` connection.
+
+    ``recv`` returns the given frames in order, then raises
+    ``ConnectionClosedOK``; ``send`` records messages in ``sent``.  Cheaper
+    and more predictable than an ``AsyncMock``.
+    """
+
+    def __init__(self, frames: list[bytes] | None = None) -> None:
+        self._frames = deque(frames or [])
+        self.sent: list[str] = []
+
+    async def recv(self, decode: bool | None = None) -> bytes:
+        if not self._frames:
+            raise ConnectionClosedOK(None, None)
+        return self._frames.popleft()
+
+    async def send(self, message: str) -> None:
+        self.sent.append(message)
+
+
 # =========================================================================
 # parse_trade_event tests (1-6)
 # =========================================================================
@@ -146,6 +169,46 @@ class TestParseTradeEvent:
         assert result[5] is None
 
 
+class TestParseTradeFrame:
+    """Tests for the parse_trade_frame function."""
+
+    def test_parse_frame_matches_parse_trade_event(self) -> None:
+        """Struct-decoded trades equal the dict-parsed ones."""
+        event = _make_trade_event()
+        frame = json.dumps(event).encode()
+
+        assert parse_trade_frame(frame) == [parse_trade_event(event)]
+
+    def test_parse_frame_skips_other_event_types(self) -> None:
+        """Non-trade events in an array frame are skipped."""
+        book = {
+            "event_type": "book",
+            "asset_id": "tok1",
+            "bids": [{"price": "0.50", "size": "10"}],
+            "asks": [],
+        }
+        frame = json.dumps(
+            [book, _make_trade_event(asset_id="tok2")]
+        ).encode()
+
+        result = parse_trade_frame(frame)
+
+        assert [trade[1] for trade in result] == ["tok2"]
+
+    def test_parse_frame_drops_only_malformed_events(self) -> None:
+        """A malformed trade drops itself, not the rest of the frame."""
+        frame = json.dumps([
+            _make_trade_event(asset_id="tok1"),
+            _make_trade_event(asset_id="tok_bad", price="invalid"),
+            {"event_type": "last_trade_price"},
+            _make_trade_event(asset_id="tok2"),
+        ]).encode()
+
+        result = parse_trade_frame(frame)
+
+        assert [trade[1] for trade in result] == ["tok1", "tok2"]
+
+
 # =========================================================================
 # _subscribe test (7)
 # =========================================================================
@@ -157,13 +220,14 @@ class TestSubscribe:
     async def test_subscribe_sends_correct_json(self) -> None:
         """_subscribe sends the correct subscription JSON."""
         listener = _make_listener()
-        ws = AsyncMock()
+        ws = _FakeWS()
 
-        await listener._subscribe(ws, ["tok1", "tok2"])
+        message = listener._subscription_message(["tok1", "tok2"])
+        await listener._subscribe(ws, message, 2)
 
-        ws.send.assert_called_once_with(
+        assert ws.sent == [
             json.dumps({"assets_ids": ["tok1", "tok2"], "type": "market"})
-        )
+        ]
 
 
 # =========================================================================
@@ -175,31 +239,21 @@ class TestPingLoop:
     """Tests for TradeListener._ping_loop."""
 
     async def test_ping_loop_sends_ping(self) -> None:
-        """_ping_loop sends PING at least twice over ~0.3s with 0.1s interval."""
-        listener = _make_listener(ws_ping_interval_sec=0)
+        """_ping_loop sends PING each interval until _running is cleared."""
         # Use interval=0 so pings fire as fast as possible
-        listener.config.ws_ping_interval_sec = 0
-        ws = AsyncMock()
+        listener = _make_listener(ws_ping_interval_sec=0)
+        ws = _FakeWS()
 
-        # Run _ping_loop as a task for a short duration
-        task = asyncio.create_task(listener._ping_loop(ws))
-        await asyncio.sleep(0.15)
-        listener._running = False
-        # Give it time to notice _running is False
-        await asyncio.sleep(0.05)
-        task.cancel()
-        try:
-            await task
-        except asyncio.CancelledError:
-            pass
+        async def send(message: str) -> None:
+            ws.sent.append(message)
+            if len(ws.sent) == 2:
+                listener._running = False
 
-        # Should have sent PING at least twice
-        ping_calls = [
-            call for call in ws.send.call_args_list if call.args[0] == "PING"
-        ]
-        assert len(ping_calls) >= 2, (
-            f"Expected at least 2 PINGs, got {len(ping_calls)}"
-        )
+        ws.send = send
+
+        await asyncio.wait_for(listener._ping_loop(ws), timeout=1.0)
+
+        assert ws.sent == ["PING", "PING"]
 
 
 # =========================================================================
@@ -212,14 +266,11 @@ class TestDrainLoop:
 
     async def test_drain_loop_batches_and_inserts(self) -> None:
         """_drain_loop batches up to trade_buffer_size and calls insert_trades."""
-        listener = _make_listener(
-            trade_buffer_size=3,
-            trade_batch_drain_timeout_sec=0.5,
-        )
+        listener = _make_listener(trade_buffer_size=3, running=False)
 
         # Pre-fill queue with 5 trade tuples
         for i in range(5):
-            listener._queue.put_nowait(
+            listener._queue.append(
                 _make_trade_tuple(token_id=f"tok{i}")
             )
 
@@ -233,52 +284,53 @@ class TestDrainLoop:
             "src.collector.trade_listener.insert_trades",
             side_effect=mock_insert,
         ):
-            # Run drain for a short time, then stop
-            task = asyncio.create_task(listener._drain_loop())
-            # Wait enough for drain to process
-            await asyncio.sleep(0.3)
-            listener._running = False
-            await asyncio.sleep(0.8)
-            task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
-
-        # All 5 trades should have been inserted
-        total_inserted = sum(len(b) for b in inserted_batches)
-        assert total_inserted == 5, (
-            f"Expected 5 total trades inserted, got {total_inserted}"
-        )
-        # First batch should be capped at trade_buffer_size=3
-        assert len(inserted_batches[0]) == 3
+            # Not running: drains what is queued, then returns
+            await listener._drain_loop()
+
+        # Queued trades go out immediately in full batches: 3 + 2
+        assert [len(b) for b in inserted_batches] == [3, 2]
 
     async def test_drain_loop_handles_insert_error(self) -> None:
         """_drain_loop logs error and continues if insert_trades raises."""
-        listener = _make_listener(
-            trade_buffer_size=10,
-            trade_batch_drain_timeout_sec=0.5,
-        )
+        listener = _make_listener(trade_buffer_size=10, running=False)
 
         # Pre-fill queue
-        listener._queue.put_nowait(_make_trade_tuple())
+        listener._queue.append(_make_trade_tuple())
 
         with patch(
             "src.collector.trade_listener.insert_trades",
             side_effect=Exception("DB error"),
+        ):
+            await listener._drain_loop()
+
+        # Should not crash — queue should be empty (item was consumed)
+        assert not listener._queue
+
+    async def test_drain_loop_flushes_on_arrival(self) -> None:
+        """An idle _drain_loop inserts a trade as soon as it is queued."""
+        listener = _make_listener()
+        inserted = asyncio.Event()
+
+        async def mock_insert(pool, batch):
+            inserted.set()
+            return len(batch)
+
+        with patch(
+            "src.collector.trade_listener.insert_trades",
+            side_effect=mock_insert,
         ):
             task = asyncio.create_task(listener._drain_loop())
-            await asyncio.sleep(0.3)
-            listener._running = False
-            await asyncio.sleep(0.8)
+            await asyncio.sleep(0)  # let it park on the empty queue
+            assert listener._queue_wake is not None
+
+            listener._queue.append(_make_trade_tuple())
+            listener._queue_wake.set_result(None)
+            await asyncio.wait_for(inserted.wait(), timeout=1.0)
+
             task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
+            await asyncio.gather(task, return_exceptions=True)
 
-        # Should not crash — queue should be empty (item was consumed)
-        assert listener._queue.empty()
+        assert listener.health.batches_inserted == 1
 
 
 # =========================================================================
@@ -297,22 +349,12 @@ class TestReceiveLoop:
         event2 = _make_trade_event(asset_id="tok2")
         array_msg = json.dumps([event1, event2])
 
-        # Create a mock WS that yields one array message then stops
-        ws = AsyncMock()
-        ws.__aiter__ = lambda self: self
-        messages = iter([array_msg])
-
-        async def anext_impl(self):
-            try:
-                return next(messages)
-            except StopIteration:
-                raise StopAsyncIteration
-
-        ws.__anext__ = anext_impl
+        # Mock WS that yields one array message then closes
+        ws = _FakeWS([array_msg.encode()])
 
         await listener._receive_loop(ws)
 
-        assert listener._queue.qsize() == 2
+        assert len(listener._queue) == 2
 
     async def test_receive_loop_handles_dict_message(self) -> None:
         """_receive_loop enqueues a trade from a single JSON dict message."""
@@ -321,22 +363,12 @@ class TestReceiveLoop:
         event1 = _make_trade_event(asset_id="tok1")
         dict_msg = json.dumps(event1)
 
-        # Create a mock WS that yields one dict message then stops
-        ws = AsyncMock()
-        ws.__aiter__ = lambda self: self
-        messages = iter([dict_msg])
-
-        async def anext_impl(self):
-            try:
-                return next(messages)
-            except StopIteration:
-                raise StopAsyncIteration
-
-        ws.__anext__ = anext_impl
+        # Mock WS that yields one dict message then closes
+        ws = _FakeWS([dict_msg.encode()])
 
         await listener._receive_loop(ws)
 
-        assert listener._queue.qsize() == 1
+        assert len(listener._queue) == 1
 
 
 # =========================================================================
@@ -451,17 +483,23 @@ class TestLifecycle:
         # Mock _get_active_token_ids to return tokens
         listener._get_active_token_ids = AsyncMock(return_value=["t1", "t2"])
 
-        # Mock _listen_single and _drain_loop to sleep forever
-        async def sleep_forever(*args, **kwargs):
+        # Replace _listen_single and _drain_loop with tasks that block
+        # forever, signalling once the drain loop has started
+        drain_started = asyncio.Event()
+
+        async def sleep_forever(*args) -> None:
+            await asyncio.sleep(3600)
+
+        async def drain_forever() -> None:
+            drain_started.set()
             await asyncio.sleep(3600)
 
-        listener._listen_single = AsyncMock(side_effect=sleep_forever)
-        listener._drain_loop = AsyncMock(side_effect=sleep_forever)
+        listener._listen_single = sleep_forever
+        listener._drain_loop = drain_forever
 
         # Start run() as a background task
         run_task = asyncio.create_task(listener.run())
-        # Give time for tasks to start
-        await asyncio.sleep(0.1)
+        await asyncio.wait_for(drain_started.wait(), timeout=1.0)
 
         # Verify tasks exist
         assert len(listener._tasks) > 0
@@ -487,7 +525,7 @@ class TestLifecycle:
 
         # Put trade tuples in queue
         for i in range(3):
-            listener._queue.put_nowait(
+            listener._queue.append(
                 _make_trade_tuple(token_id=f"tok{i}")
             )
 
@@ -505,7 +543,7 @@ class TestLifecycle:
 
         # All 3 trades should have been flushed
         assert len(inserted) == 3
-        assert listener._queue.empty()
+        assert not listener._queue
 
 
 # =========================================================================
@@ -534,26 +572,13 @@ class TestHealthState:
 
     async def test_health_updates_on_trades(self) -> None:
         """Health counters update when trades are received and inserted."""
-        listener = _make_listener(
-            trade_buffer_size=10,
-            trade_batch_drain_timeout_sec=0.5,
-        )
+        listener = _make_listener(trade_buffer_size=10)
 
         # Test _receive_loop health updates: mock WS to yield one trade
         event = _make_trade_event(asset_id="tok1")
         msg = json.dumps(event)
 
-        ws = AsyncMock()
-        ws.__aiter__ = lambda self: self
-        messages = iter([msg])
-
-        async def anext_impl(self):
-            try:
-                return next(messages)
-            except StopIteration:
-                raise StopAsyncIteration
-
-        ws.__anext__ = anext_impl
+        ws = _FakeWS([msg.encode()])
 
         await listener._receive_loop(ws)
 
@@ -567,19 +592,12 @@ class TestHealthState:
             inserted_batches.append(list(batch))
             return len(batch)
 
+        listener._running = False
         with patch(
             "src.collector.trade_listener.insert_trades",
             side_effect=mock_insert,
         ):
-            task = asyncio.create_task(listener._drain_loop())
-            await asyncio.sleep(0.3)
-            listener._running = False
-            await asyncio.sleep(0.8)
-            task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
+            await listener._drain_loop()
 
         assert listener.health.trades_inserted == 1
         assert listener.health.batches_inserted == 1
@@ -591,7 +609,7 @@ class TestHealthState:
 
         # Put 5 items in queue
         for i in range(5):
-            listener._queue.put_nowait(
+            listener._queue.append(
                 _make_trade_tuple(token_id=f"tok{i}")
             )
 
@@ -1,10 +1,18 @@
 """Shared pytest fixtures for the polymarket-stat-arb test suite.
 
 Provides:
-- Windows event loop policy fixture (session-scoped)
+- ``--run-integration`` option; tests needing the database are marked
+  ``integration`` and skipped without it
+- Event loop policy, set at import time: uvloop when installed (matching
+  the collector daemon), the selector loop on Windows
 - TimescaleDB testcontainer fixture (session-scoped)
-- asyncpg pool fixture connected to the test container (function-scoped)
+- asyncpg pool fixture connected to the test container (session-scoped)
 - Database cleanup fixture for test isolation (function-scoped)
+
+The suite is xdist-safe: ``pytest -n auto`` runs each worker in its own
+process with its own session fixtures, so every worker gets a private
+TimescaleDB container and the DB tests migrate in parallel instead of
+serially.
 """
 
 import asyncio
@@ -24,21 +32,62 @@ except ImportError:
 
 import asyncpg
 
+from src.db.pool import register_jsonb_codec
+
 
 # ---------------------------------------------------------------------------
-# Event loop policy — MUST run before any async fixtures on Windows
+# Integration tests — opt in with --run-integration
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture(scope="session", autouse=True)
-def _set_event_loop_policy() -> Generator[None, None, None]:
-    """Use WindowsSelectorEventLoopPolicy on Windows for asyncpg compat."""
-    if sys.platform == "win32":
-        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
-    yield
-    # Restore default policy after the session
-    if sys.platform == "win32":
-        asyncio.set_event_loop_policy(None)
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--run-integration",
+        action="store_true",
+        default=False,
+        help="run tests that need a TimescaleDB container (Docker)",
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """Mark every test that needs ``db_pool`` as ``integration``.
+
+    ``fixturenames`` includes indirect dependencies, so tests using
+    ``migrated_pool`` or ``clean_db`` are covered too.  Without
+    ``--run-integration`` these tests are skipped, so a plain ``pytest``
+    run needs no Docker and starts no container.
+    """
+    run_integration = config.getoption("--run-integration")
+    skip = pytest.mark.skip(reason="needs --run-integration")
+    for item in items:
+        if "db_pool" in item.fixturenames:
+            item.add_marker(pytest.mark.integration)
+            if not run_integration:
+                item.add_marker(skip)
+
+
+# ---------------------------------------------------------------------------
+# Event loop policy — set at import, before pytest-asyncio creates any loop
+# ---------------------------------------------------------------------------
+
+# Setting the policy while conftest is imported guarantees it is in place
+# before pytest-asyncio builds the session loop; the policy is
+# process-local, so nothing needs restoring afterwards.  Tests run on
+# uvloop when it is installed, like the daemon (see src.main), and
+# asyncpg needs the selector loop on Windows, where uvloop is unavailable.
+try:
+    import uvloop
+
+    _HAS_UVLOOP = True
+except ImportError:
+    _HAS_UVLOOP = False
+
+if _HAS_UVLOOP:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+elif sys.platform == "win32":
+    asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
 
 # ---------------------------------------------------------------------------
@@ -46,12 +95,25 @@ def _set_event_loop_policy() -> Generator[None, None, None]:
 # ---------------------------------------------------------------------------
 
 
+# Test-only server settings: the container is thrown away after the
+# session, so durability (fsync, WAL page images) is pure overhead.
+_TEST_POSTGRES_COMMAND = (
+    "postgres"
+    " -c fsync=off"
+    " -c synchronous_commit=off"
+    " -c full_page_writes=off"
+)
+
+
 @pytest.fixture(scope="session")
 def timescaledb_container() -> Generator:
     """Start a TimescaleDB container for the test session.
 
     Requires Docker to be running. Tests that use this fixture will be
-    skipped automatically if testcontainers is not installed.
+    skipped automatically if testcontainers is not installed.  Under
+    pytest-xdist each worker starts its own container, so workers never
+    share tables.  The server runs with durability turned off (see
+    ``_TEST_POSTGRES_COMMAND``).
     """
     if not _HAS_TESTCONTAINERS:
         pytest.skip("testcontainers not installed or Docker unavailable")
@@ -61,23 +123,40 @@ def timescaledb_container() -> Generator:
         username="test",
         password="test",
         dbname="testdb",
-    ) as container:
+    ).with_command(_TEST_POSTGRES_COMMAND) as container:
         yield container
 
 
 # ---------------------------------------------------------------------------
-# asyncpg pool (function-scoped for isolation)
+# asyncpg pool (session-scoped — connections reused across tests)
 # ---------------------------------------------------------------------------
 
+# Fixed pool size: every connection is opened once at session start.
+_TEST_POOL_SIZE = 8
 
-@pytest.fixture
+
+class _NoResetConnection(asyncpg.Connection):
+    """Connection that skips the reset query when released to the pool.
+
+    asyncpg still rolls back any open transaction on release; only the
+    ``RESET ALL; CLOSE ALL; UNLISTEN *; ...`` round trip is dropped.  Tests
+    do not rely on session-level settings, so the reset is pure overhead.
+    """
+
+    def get_reset_query(self) -> str:
+        return ""
+
+
+@pytest.fixture(scope="session")
 async def db_pool(
     timescaledb_container,
 ) -> AsyncGenerator[asyncpg.Pool, None]:
-    """Create a fresh asyncpg pool for each test, connected to the container.
+    """Create one asyncpg pool for the whole session, connected to the container.
 
     Enables the timescaledb extension on first connect and tears down the
-    pool after the test completes.
+    pool after the last test completes.  Every connection decodes JSONB to
+    Python objects (see ``register_jsonb_codec``).  Per-test isolation is provided by
+    the ``clean_db`` / ``migrated_pool`` fixtures, not by the pool.
     """
     host = timescaledb_container.get_container_host_ip()
     port = int(timescaledb_container.get_exposed_port(5432))
@@ -88,8 +167,13 @@ async def db_pool(
         user="test",
         password="test",
         database="testdb",
-        min_size=1,
-        max_size=3,
+        min_size=_TEST_POOL_SIZE,
+        max_size=_TEST_POOL_SIZE,
+        connection_class=_NoResetConnection,
+        init=register_jsonb_codec,
+        # Keep prepared statements for the whole session instead of
+        # re-preparing them after asyncpg's default 300s lifetime.
+        max_cached_statement_lifetime=0,
     )
 
     # Ensure TimescaleDB extension is available
@@ -105,17 +189,15 @@ async def db_pool(
 # Database cleanup (function-scoped for isolation)
 # ---------------------------------------------------------------------------
 
-# Tables created by the application (expanded as schema evolves).
+# Objects created by the application (expanded as schema evolves), dropped
+# in one round trip: continuous aggregates first, then the tables.
 # schema_migrations is intentionally excluded to preserve migration state.
-_APPLICATION_TABLES = [
-    "price_candles_1h",
-    "trade_volume_1h",
-    "price_snapshots",
-    "orderbook_snapshots",
-    "trades",
-    "markets",
-    "resolutions",
-]
+_DROP_APPLICATION_TABLES_SQL = """
+DROP MATERIALIZED VIEW IF EXISTS price_candles_1h, trade_volume_1h CASCADE;
+DROP TABLE IF EXISTS
+    price_snapshots, orderbook_snapshots, trades, markets, resolutions
+CASCADE;
+"""
 
 
 @pytest.fixture
@@ -128,8 +210,6 @@ async def clean_db(db_pool: asyncpg.Pool) -> asyncpg.Pool:
             async with clean_db.acquire() as conn:
                 ...
     """
-    async with db_pool.acquire() as conn:
-        for table in _APPLICATION_TABLES:
-            await conn.execute(f"DROP TABLE IF EXISTS {table} CASCADE;")
+    await db_pool.execute(_DROP_APPLICATION_TABLES_SQL)
 
     return db_pool
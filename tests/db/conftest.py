@@ -1,77 +1,100 @@
 """Shared fixtures for database integration tests.
 
-Provides a ``migrated_pool`` fixture that runs all SQL migrations
-against the test container before each test, ensuring the full schema
-is available.
+Provides a ``migrated_pool`` fixture with the full schema applied.
+Migrations run once per test class (``_migrated_schema``); each test then
+starts from empty data tables.
 """
 
 import asyncio
+import random
 from pathlib import Path
+from typing import Awaitable, Callable, TypeVar
 
 import asyncpg
 import pytest
 
 from src.db.migrations.runner import run_migrations
 
+T = TypeVar("T")
+
 MIGRATIONS_DIR = Path(__file__).resolve().parents[2] / "src" / "db" / "migrations"
 
+# Tables the application writes to; emptied before every test.
+_DATA_TABLES = (
+    "markets",
+    "price_snapshots",
+    "orderbook_snapshots",
+    "trades",
+    "resolutions",
+)
+
+# Clean slate in one round trip: continuous aggregates first (they depend
+# on the hypertables), then every table.
+_DROP_SCHEMA_SQL = f"""
+DROP MATERIALIZED VIEW IF EXISTS price_candles_1h, trade_volume_1h CASCADE;
+DROP TABLE IF EXISTS schema_migrations, {', '.join(_DATA_TABLES)} CASCADE;
+"""
+
+_UNLOGGED_TABLES_SQL = """
+ALTER TABLE markets SET UNLOGGED;
+ALTER TABLE resolutions SET UNLOGGED;
+"""
+
 
-async def _drop_with_retry(
-    conn: asyncpg.Connection, sql: str, max_retries: int = 3, delay: float = 0.5
-) -> None:
-    """Execute a DROP statement with retries for TimescaleDB deadlocks.
+async def _retry_on_deadlock(
+    fn: Callable[..., Awaitable[T]],
+    *args,
+    max_retries: int = 5,
+    base_delay: float = 0.1,
+) -> T:
+    """Await ``fn(*args)``, retrying on TimescaleDB deadlocks.
 
     After COPY bulk inserts into hypertables, TimescaleDB background
-    workers may briefly hold advisory locks.  Retrying after a short
-    delay resolves the intermittent deadlock.
+    workers may briefly hold advisory locks, so DDL can deadlock against
+    them.  Retries back off exponentially with jitter so concurrent
+    xdist workers do not retry in lockstep.
     """
     for attempt in range(max_retries):
         try:
-            await conn.execute(sql)
-            return
+            return await fn(*args)
         except asyncpg.DeadlockDetectedError:
             if attempt == max_retries - 1:
                 raise
-            await asyncio.sleep(delay * (attempt + 1))
+            await asyncio.sleep(
+                base_delay * 2**attempt + random.uniform(0, base_delay)
+            )
+    raise AssertionError("unreachable")
 
 
-@pytest.fixture
-async def migrated_pool(db_pool: asyncpg.Pool) -> asyncpg.Pool:
-    """Run all migrations and return the pool with full schema.
+@pytest.fixture(scope="class")
+async def _migrated_schema(db_pool: asyncpg.Pool) -> asyncpg.Pool:
+    """Drop all application objects and re-run every migration.
 
-    Drops all application objects first to ensure a clean slate, then
-    applies every migration from 001 through 008.  Data tables are
-    truncated so each test starts with an empty dataset.
+    Class-scoped rather than session-scoped: ``test_migrations.py`` drops
+    ``schema_migrations`` on the same database, so each class re-applies
+    migrations 001 through 009 from a clean slate.
     """
     async with db_pool.acquire() as conn:
-        # Clean slate: drop everything in reverse dependency order
-        await _drop_with_retry(
-            conn, "DROP TABLE IF EXISTS schema_migrations CASCADE;"
-        )
-
-        # Drop continuous aggregates first (they depend on hypertables)
-        await _drop_with_retry(
-            conn,
-            "DROP MATERIALIZED VIEW IF EXISTS price_candles_1h CASCADE;",
-        )
-        await _drop_with_retry(
-            conn,
-            "DROP MATERIALIZED VIEW IF EXISTS trade_volume_1h CASCADE;",
-        )
-
-        # Drop tables
-        for table in [
-            "price_snapshots",
-            "orderbook_snapshots",
-            "trades",
-            "markets",
-            "resolutions",
-        ]:
-            await _drop_with_retry(
-                conn, f"DROP TABLE IF EXISTS {table} CASCADE;"
-            )
+        await _retry_on_deadlock(conn.execute, _DROP_SCHEMA_SQL)
 
     applied = await run_migrations(db_pool, MIGRATIONS_DIR)
-    assert len(applied) == 8, f"Expected 8 migrations, got {len(applied)}: {applied}"
+    assert len(applied) == 9, f"Expected 9 migrations, got {len(applied)}: {applied}"
+
+    # Test data needs no crash safety, so skip WAL for the plain tables
+    # (TimescaleDB does not allow UNLOGGED hypertables).
+    await db_pool.execute(_UNLOGGED_TABLES_SQL)
 
     return db_pool
+
+
+@pytest.fixture
+async def migrated_pool(_migrated_schema: asyncpg.Pool) -> asyncpg.Pool:
+    """Return the class's migrated pool with all data tables emptied.
+
+    TRUNCATE is far cheaper than re-running the migrations, and every
+    test still starts from empty tables.
+    """
+    await _migrated_schema.execute(
+        f"TRUNCATE {', '.join(_DATA_TABLES)} RESTART IDENTITY CASCADE"
+    )
+    return _migrated_schema
@@ -15,6 +15,7 @@ Steps:
 9. Verify get_latest_prices returns one per token
 """
 
+import asyncio
 from datetime import datetime, timedelta, timezone
 
 import asyncpg
@@ -156,41 +157,61 @@ class TestFullIntegration:
         assert resolution.outcome == "Yes"
 
         # ---- Step 6: Query each table and verify integrity ----
+        # The reads are independent, so run them concurrently across the
+        # pool's connections.
+        (
+            active,
+            latest_prices,
+            orderbooks,
+            recent_trades,
+            trade_counts,
+        ) = await asyncio.gather(
+            get_active_markets(migrated_pool),
+            get_latest_prices(migrated_pool, token_ids),
+            asyncio.gather(
+                *(get_latest_orderbook(migrated_pool, tid) for tid in token_ids)
+            ),
+            asyncio.gather(
+                *(
+                    get_recent_trades(migrated_pool, tid, limit=10)
+                    for tid in token_ids
+                )
+            ),
+            asyncio.gather(
+                *(
+                    get_trade_count(migrated_pool, token_id=tid)
+                    for tid in token_ids
+                )
+            ),
+        )
 
         # Markets: active markets should be markets 0 and 1
-        active = await get_active_markets(migrated_pool)
         active_ids = {m.condition_id for m in active}
         assert "0x_integ_0" in active_ids
         assert "0x_integ_1" in active_ids
         assert "0x_integ_2" not in active_ids
 
         # Prices: get_latest_prices returns one per token
-        latest_prices = await get_latest_prices(migrated_pool, token_ids)
         assert len(latest_prices) == 3
         price_map = {p.token_id: p for p in latest_prices}
         for tid in token_ids:
             assert tid in price_map
 
         # Orderbooks: get_latest_orderbook returns a snapshot
-        for tid in token_ids:
-            ob = await get_latest_orderbook(migrated_pool, tid)
+        for tid, ob in zip(token_ids, orderbooks):
             assert ob is not None
             assert ob.token_id == tid
             assert ob.bids is not None
 
         # Trades: get_recent_trades for each token
-        for tid in token_ids:
-            recent = await get_recent_trades(migrated_pool, tid, limit=10)
+        for recent in recent_trades:
             assert len(recent) > 0
             # Verify ordering
             for k in range(len(recent) - 1):
                 assert recent[k].ts >= recent[k + 1].ts
 
         # Trade count by token
-        count_0 = await get_trade_count(migrated_pool, token_id=token_ids[0])
-        count_1 = await get_trade_count(migrated_pool, token_id=token_ids[1])
-        count_2 = await get_trade_count(migrated_pool, token_id=token_ids[2])
-        assert count_0 + count_1 + count_2 == 50
+        assert sum(trade_counts) == 50
 
         # ---- Step 7: Verify get_unresolved_markets ----
         # Market 2 is closed AND has a resolution -> NOT unresolved
@@ -8,8 +8,6 @@ Tests cover:
 5. get_markets_by_ids returns matching markets using ANY($1::text[])
 """
 
-import asyncio
-
 import asyncpg
 import pytest
 
@@ -75,10 +73,8 @@ class TestUpsertMarket:
         assert original is not None
         original_updated_at = original.updated_at
 
-        # Small delay to ensure updated_at changes
-        await asyncio.sleep(0.05)
-
-        # Upsert again with updated question
+        # Upsert again with updated question.  No sleep needed: each
+        # upsert runs in its own transaction, so its NOW() is later.
         market_data["question"] = "Updated question?"
         market_data["slug"] = "updated-slug"
         await upsert_market(migrated_pool, market_data)
@@ -4,6 +4,7 @@ TDD test cases for src.db.migrations.runner.run_migrations().
 Tests use a real TimescaleDB container via testcontainers (see conftest.py).
 """
 
+import shutil
 from pathlib import Path
 from textwrap import dedent
 
@@ -31,17 +32,26 @@ async def fresh_pool(db_pool: asyncpg.Pool) -> asyncpg.Pool:
     return db_pool
 
 
-@pytest.fixture
-def migrations_dir(tmp_path: Path) -> Path:
-    """Create a temporary migrations directory with 001_extensions.sql."""
-    d = tmp_path / "migrations"
-    d.mkdir()
+@pytest.fixture(scope="session")
+def base_migrations_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a read-only migrations directory with 001_extensions.sql once.
+
+    Tests that only run the existing migration use it directly; tests
+    that add files use a per-test copy (``migrations_dir``).
+    """
+    d = tmp_path_factory.mktemp("migrations")
     (d / "001_extensions.sql").write_text(
         "CREATE EXTENSION IF NOT EXISTS timescaledb;\n"
     )
     return d
 
 
+@pytest.fixture
+def migrations_dir(base_migrations_dir: Path, tmp_path: Path) -> Path:
+    """Copy the base migrations directory for a test that adds files."""
+    return Path(shutil.copytree(base_migrations_dir, tmp_path / "migrations"))
+
+
 # ---------------------------------------------------------------------------
 # Test cases
 # ---------------------------------------------------------------------------
@@ -51,10 +61,10 @@ class TestRunMigrations:
     """Test suite for run_migrations()."""
 
     async def test_empty_database_applies_first_migration(
-        self, fresh_pool: asyncpg.Pool, migrations_dir: Path
+        self, fresh_pool: asyncpg.Pool, base_migrations_dir: Path
     ) -> None:
         """1. Empty database -> creates schema_migrations + applies 001 -> returns ['001_extensions.sql']."""
-        applied = await run_migrations(fresh_pool, migrations_dir)
+        applied = await run_migrations(fresh_pool, base_migrations_dir)
 
         assert applied == ["001_extensions.sql"]
 
@@ -68,11 +78,11 @@ class TestRunMigrations:
             assert row["filename"] == "001_extensions.sql"
 
     async def test_idempotent_no_new_migrations(
-        self, fresh_pool: asyncpg.Pool, migrations_dir: Path
+        self, fresh_pool: asyncpg.Pool, base_migrations_dir: Path
     ) -> None:
         """2. Run again with same files -> returns [] (no new migrations)."""
-        await run_migrations(fresh_pool, migrations_dir)
-        applied = await run_migrations(fresh_pool, migrations_dir)
+        await run_migrations(fresh_pool, base_migrations_dir)
+        applied = await run_migrations(fresh_pool, base_migrations_dir)
 
         assert applied == []
 
@@ -137,10 +147,10 @@ class TestRunMigrations:
             assert ts_row["applied_at"] is not None
 
     async def test_timescaledb_extension_active_after_001(
-        self, fresh_pool: asyncpg.Pool, migrations_dir: Path
+        self, fresh_pool: asyncpg.Pool, base_migrations_dir: Path
     ) -> None:
         """5. Verify TimescaleDB extension is active after 001 runs."""
-        await run_migrations(fresh_pool, migrations_dir)
+        await run_migrations(fresh_pool, base_migrations_dir)
 
         async with fresh_pool.acquire() as conn:
             row = await conn.fetchrow(
@@ -9,14 +9,18 @@ Tests cover:
 6. get_price_history respects limit parameter
 7. insert_price_snapshots with empty list -> no error, returns 0
 8. Verify data lands in hypertable (timescaledb_information.hypertables)
+9. get_price_history over one day scans at most two chunks (chunk exclusion)
 """
 
+import json
 from datetime import datetime, timedelta, timezone
+from itertools import pairwise
 
 import asyncpg
 import pytest
 
 from src.db.queries.prices import (
+    _PRICE_HISTORY_SQL,
     get_latest_prices,
     get_price_count,
     get_price_history,
@@ -24,6 +28,14 @@ from src.db.queries.prices import (
 )
 
 
+def _scanned_relations(plan: dict) -> list[str]:
+    """Collect every relation name scanned in an EXPLAIN (FORMAT JSON) plan."""
+    names = [plan["Relation Name"]] if "Relation Name" in plan else []
+    for child in plan.get("Plans", ()):
+        names.extend(_scanned_relations(child))
+    return names
+
+
 def make_price_tuple(
     token_id: str,
     price: float,
@@ -124,13 +136,12 @@ class TestGetLatestPrices:
         assert len(results) == 3
 
         result_map = {r.token_id: r for r in results}
-        for token_id in token_ids:
-            assert token_id in result_map
-            # Most recent snapshot has price 0.40 + 4*0.05 = 0.60
-            assert abs(result_map[token_id].price - 0.60) < 1e-9
-            # Most recent timestamp is base_ts + 40s
-            expected_ts = base_ts + timedelta(seconds=40)
-            assert result_map[token_id].ts == expected_ts
+        assert result_map.keys() == set(token_ids)
+        # Most recent snapshot: price 0.40 + 4*0.05 = 0.60 at base_ts + 40s
+        expected_ts = base_ts + timedelta(seconds=40)
+        for latest in result_map.values():
+            assert abs(latest.price - 0.60) < 1e-9
+            assert latest.ts == expected_ts
 
     async def test_nonexistent_token_ids_returns_empty(
         self, migrated_pool: asyncpg.Pool
@@ -171,9 +182,8 @@ class TestGetPriceHistory:
         results = await get_price_history(migrated_pool, token_id, start, end)
 
         assert len(results) == 10
-        # Results should be ordered by ts DESC
-        for k in range(len(results) - 1):
-            assert results[k].ts > results[k + 1].ts
+        # Strictly ts DESC
+        assert all(a.ts > b.ts for a, b in pairwise(results))
         # Verify range boundaries
         assert results[0].ts == end  # most recent first
         assert results[-1].ts == start  # oldest last
@@ -208,6 +218,34 @@ class TestGetPriceHistory:
         # Should return the 10 most recent (ts DESC)
         assert results[0].ts == base_ts + timedelta(minutes=49)
 
+    async def test_single_day_query_prunes_chunks(
+        self, migrated_pool: asyncpg.Pool
+    ) -> None:
+        """A one-day window touches at most 2 of the 5 daily chunks."""
+        base_ts = datetime(2026, 3, 1, 0, 0, 0, tzinfo=timezone.utc)
+        token_id = "tok_pruned"
+
+        # One snapshot every 6 hours across 5 days -> 5 daily chunks
+        snapshots = [
+            make_price_tuple(token_id, 0.50, ts=base_ts + timedelta(hours=6 * i))
+            for i in range(20)
+        ]
+        await insert_price_snapshots(migrated_pool, snapshots)
+
+        start = base_ts + timedelta(days=2, hours=1)
+        end = base_ts + timedelta(days=2, hours=23)
+        plan_json = await migrated_pool.fetchval(
+            "EXPLAIN (FORMAT JSON) " + _PRICE_HISTORY_SQL,
+            token_id,
+            start,
+            end,
+            100,
+        )
+        relations = _scanned_relations(json.loads(plan_json)[0]["Plan"])
+        chunks = [name for name in relations if name.startswith("_hyper_")]
+
+        assert 1 <= len(chunks) <= 2, f"Expected chunk exclusion, scanned {chunks}"
+
 
 class TestHypertableVerification:
     """Verify price_snapshots is registered as a TimescaleDB hypertable."""
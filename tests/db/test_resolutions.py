@@ -11,7 +11,7 @@ from datetime import datetime, timezone
 import asyncpg
 import pytest
 
-from src.db.queries.markets import upsert_market
+from src.db.queries.markets import upsert_market, upsert_markets
 from src.db.queries.resolutions import (
     get_resolution,
     get_unresolved_markets,
@@ -109,18 +109,43 @@ class TestGetUnresolvedMarkets:
         self, migrated_pool: asyncpg.Pool
     ) -> None:
         """get_unresolved_markets returns condition_ids of closed markets with no resolution."""
-        # Insert a closed market WITH a resolution
-        await upsert_market(migrated_pool, {
-            "condition_id": "0x_has_resolution",
-            "question": "Resolved market?",
-            "slug": "resolved",
-            "market_type": "binary",
-            "outcomes": ["Yes", "No"],
-            "clob_token_ids": ["tok_y", "tok_n"],
-            "active": False,
-            "closed": True,
-            "end_date_iso": None,
-        })
+        # One batch: a closed market that gets a resolution, a closed
+        # market without one, and an active market (never unresolved)
+        await upsert_markets(migrated_pool, [
+            {
+                "condition_id": "0x_has_resolution",
+                "question": "Resolved market?",
+                "slug": "resolved",
+                "market_type": "binary",
+                "outcomes": ["Yes", "No"],
+                "clob_token_ids": ["tok_y", "tok_n"],
+                "active": False,
+                "closed": True,
+                "end_date_iso": None,
+            },
+            {
+                "condition_id": "0x_no_resolution",
+                "question": "Unresolved closed market?",
+                "slug": "unresolved",
+                "market_type": "binary",
+                "outcomes": ["Yes", "No"],
+                "clob_token_ids": ["tok_y2", "tok_n2"],
+                "active": False,
+                "closed": True,
+                "end_date_iso": None,
+            },
+            {
+                "condition_id": "0x_still_active",
+                "question": "Still active market?",
+                "slug": "active",
+                "market_type": "binary",
+                "outcomes": ["Yes", "No"],
+                "clob_token_ids": ["tok_y3", "tok_n3"],
+                "active": True,
+                "closed": False,
+                "end_date_iso": None,
+            },
+        ])
         await upsert_resolution(migrated_pool, {
             "condition_id": "0x_has_resolution",
             "outcome": "Yes",
@@ -130,34 +155,6 @@ class TestGetUnresolvedMarkets:
             "detection_method": "gamma_api",
         })
 
-        # Insert a closed market WITHOUT a resolution
-        await upsert_market(migrated_pool, {
-            "condition_id": "0x_no_resolution",
-            "question": "Unresolved closed market?",
-            "slug": "unresolved",
-            "market_type": "binary",
-            "outcomes": ["Yes", "No"],
-            "clob_token_ids": ["tok_y2", "tok_n2"],
-            "active": False,
-            "closed": True,
-            "end_date_iso": None,
-        })
-
-        # Insert an active market (should NOT appear in unresolved)
-        await upsert_market(migrated_pool, {
-            "condition_id": "0x_still_active",
-            "question": "Still active market?",
-            "slug": "active",
-            "market_type": "binary",
-            "outcomes": ["Yes", "No"],
-            "clob_token_ids": ["tok_y3", "tok_n3"],
-            "active": True,
-            "closed": False,
-            "end_date_iso": None,
-        })
-
         unresolved = await get_unresolved_markets(migrated_pool)
 
-        assert "0x_no_resolution" in unresolved
-        assert "0x_has_resolution" not in unresolved
-        assert "0x_still_active" not in unresolved
+        assert unresolved == {"0x_no_resolution"}
@@ -5,14 +5,56 @@ the end-state schema: tables, hypertables, continuous aggregates,
 compression settings, indexes, and retention policies.
 """
 
+from collections import defaultdict
+
 import asyncpg
 import pytest
 
+# Every catalog object the end-state tests check, as (kind, name) rows,
+# so the whole schema is read in one round trip.
+_SCHEMA_SNAPSHOT_SQL = """
+SELECT 'table' AS kind, tablename AS name
+FROM pg_tables WHERE schemaname = 'public'
+UNION ALL
+SELECT 'hypertable', hypertable_name
+FROM timescaledb_information.hypertables WHERE hypertable_schema = 'public'
+UNION ALL
+SELECT 'aggregate', view_name
+FROM timescaledb_information.continuous_aggregates WHERE view_schema = 'public'
+UNION ALL
+SELECT DISTINCT 'compression', hypertable_name
+FROM timescaledb_information.compression_settings WHERE hypertable_schema = 'public'
+UNION ALL
+SELECT 'index', indexname
+FROM pg_indexes WHERE schemaname = 'public'
+UNION ALL
+SELECT 'retention', hypertable_name
+FROM timescaledb_information.jobs
+WHERE proc_name = 'policy_retention' AND hypertable_schema = 'public'
+"""
+
+
+@pytest.fixture(scope="class")
+async def schema_snapshot(
+    _migrated_schema: asyncpg.Pool,
+) -> dict[str, set[str]]:
+    """Map each catalog kind to the object names present after migration.
+
+    The tests below only read the catalog, so one snapshot serves the
+    whole class.
+    """
+    snapshot: dict[str, set[str]] = defaultdict(set)
+    for kind, name in await _migrated_schema.fetch(_SCHEMA_SNAPSHOT_SQL):
+        snapshot[kind].add(name)
+    return snapshot
+
 
 class TestSchemaEndState:
     """Verify the complete schema after all migrations have run."""
 
-    async def test_all_tables_exist(self, migrated_pool: asyncpg.Pool) -> None:
+    async def test_all_tables_exist(
+        self, schema_snapshot: dict[str, set[str]]
+    ) -> None:
         """All 5 application tables should exist in the public schema."""
         expected_tables = {
             "markets",
@@ -21,109 +63,78 @@ class TestSchemaEndState:
             "trades",
             "resolutions",
         }
+        found = schema_snapshot["table"] & expected_tables
+
+        assert found == expected_tables, f"Missing tables: {expected_tables - found}"
 
+    async def test_orderbook_levels_are_scalar_jsonb(
+        self, migrated_pool: asyncpg.Pool
+    ) -> None:
+        """bids/asks should be plain JSONB, not JSONB[] (udt_name '_jsonb')."""
         async with migrated_pool.acquire() as conn:
             rows = await conn.fetch(
                 """
-                SELECT tablename FROM pg_tables
-                WHERE schemaname = 'public'
-                  AND tablename = ANY($1::text[])
-                """,
-                list(expected_tables),
+                SELECT column_name, udt_name
+                FROM information_schema.columns
+                WHERE table_schema = 'public'
+                  AND table_name = 'orderbook_snapshots'
+                  AND column_name IN ('bids', 'asks')
+                """
             )
-            found = {r["tablename"] for r in rows}
+            found = {r["column_name"]: r["udt_name"] for r in rows}
 
-        assert found == expected_tables, f"Missing tables: {expected_tables - found}"
+        assert found == {"bids": "jsonb", "asks": "jsonb"}
 
-    async def test_hypertables_exist(self, migrated_pool: asyncpg.Pool) -> None:
+    async def test_hypertables_exist(
+        self, schema_snapshot: dict[str, set[str]]
+    ) -> None:
         """3 hypertables should exist: price_snapshots, orderbook_snapshots, trades."""
         expected = {"price_snapshots", "orderbook_snapshots", "trades"}
-
-        async with migrated_pool.acquire() as conn:
-            rows = await conn.fetch(
-                """
-                SELECT hypertable_name
-                FROM timescaledb_information.hypertables
-                WHERE hypertable_schema = 'public'
-                """
-            )
-            found = {r["hypertable_name"] for r in rows}
+        found = schema_snapshot["hypertable"]
 
         assert expected.issubset(found), f"Missing hypertables: {expected - found}"
 
     async def test_continuous_aggregates_exist(
-        self, migrated_pool: asyncpg.Pool
+        self, schema_snapshot: dict[str, set[str]]
     ) -> None:
         """2 continuous aggregates should exist: price_candles_1h, trade_volume_1h."""
         expected = {"price_candles_1h", "trade_volume_1h"}
-
-        async with migrated_pool.acquire() as conn:
-            rows = await conn.fetch(
-                """
-                SELECT view_name
-                FROM timescaledb_information.continuous_aggregates
-                WHERE view_schema = 'public'
-                """
-            )
-            found = {r["view_name"] for r in rows}
+        found = schema_snapshot["aggregate"]
 
         assert expected.issubset(found), f"Missing aggregates: {expected - found}"
 
-    async def test_compression_enabled(self, migrated_pool: asyncpg.Pool) -> None:
+    async def test_compression_enabled(
+        self, schema_snapshot: dict[str, set[str]]
+    ) -> None:
         """Compression should be enabled on all 3 hypertables."""
         expected = {"price_snapshots", "orderbook_snapshots", "trades"}
-
-        async with migrated_pool.acquire() as conn:
-            rows = await conn.fetch(
-                """
-                SELECT hypertable_name
-                FROM timescaledb_information.compression_settings
-                WHERE hypertable_schema = 'public'
-                """
-            )
-            found = {r["hypertable_name"] for r in rows}
+        found = schema_snapshot["compression"]
 
         assert expected.issubset(found), f"Missing compression: {expected - found}"
 
-    async def test_indexes_exist(self, migrated_pool: asyncpg.Pool) -> None:
+    async def test_indexes_exist(
+        self, schema_snapshot: dict[str, set[str]]
+    ) -> None:
         """Key indexes should exist on time-series tables."""
         expected_indexes = {
             "idx_markets_active",
+            "idx_markets_slug_prefix",
             "idx_price_snapshots_token_time",
             "idx_orderbook_snapshots_token_time",
             "idx_trades_token_time",
             "idx_trades_trade_id",
         }
-
-        async with migrated_pool.acquire() as conn:
-            rows = await conn.fetch(
-                """
-                SELECT indexname FROM pg_indexes
-                WHERE schemaname = 'public'
-                  AND indexname = ANY($1::text[])
-                """,
-                list(expected_indexes),
-            )
-            found = {r["indexname"] for r in rows}
+        found = schema_snapshot["index"] & expected_indexes
 
         assert found == expected_indexes, (
             f"Missing indexes: {expected_indexes - found}"
         )
 
     async def test_retention_policies_exist(
-        self, migrated_pool: asyncpg.Pool
+        self, schema_snapshot: dict[str, set[str]]
     ) -> None:
         """Retention policies should exist on price_snapshots and trades."""
-        async with migrated_pool.acquire() as conn:
-            rows = await conn.fetch(
-                """
-                SELECT hypertable_name
-                FROM timescaledb_information.jobs
-                WHERE proc_name = 'policy_retention'
-                  AND hypertable_schema = 'public'
-                """
-            )
-            found = {r["hypertable_name"] for r in rows}
+        found = schema_snapshot["retention"]
 
         expected = {"price_snapshots", "trades"}
         assert expected.issubset(found), (
@@ -133,8 +144,8 @@ class TestSchemaEndState:
     async def test_schema_migrations_tracked(
         self, migrated_pool: asyncpg.Pool
     ) -> None:
-        """schema_migrations should have exactly 8 rows after full migration."""
+        """schema_migrations should have exactly 9 rows after full migration."""
         async with migrated_pool.acquire() as conn:
             count = await conn.fetchval("SELECT count(*) FROM schema_migrations")
 
-        assert count == 8
+        assert count == 9
@@ -2,21 +2,26 @@
 
 Tests cover:
 1. insert_trades with 5 records -> all inserted
-2. insert_trades with 500 records -> bulk insert works
+2. insert_trades with 500 records -> bulk insert works; estimate after ANALYZE
 3. get_recent_trades with limit -> respects limit, ordered by ts DESC
 4. get_trade_count with no filter -> total count
 5. get_trade_count with token_id filter -> filtered count
 6. Duplicate trade_id handling
+7. Small batches use executemany, large batches use COPY (no DB)
 """
 
 from datetime import datetime, timedelta, timezone
+from itertools import pairwise
+from unittest.mock import AsyncMock
 
 import asyncpg
 import pytest
 
 from src.db.queries.trades import (
+    _COPY_MIN_ROWS,
     get_recent_trades,
     get_trade_count,
+    get_trade_count_estimate,
     insert_trades,
 )
 
@@ -87,6 +92,11 @@ class TestInsertTrades:
         total = await get_trade_count(migrated_pool)
         assert total == 500
 
+        # The estimate reads chunk statistics, so it needs fresh ANALYZE data
+        await migrated_pool.execute("ANALYZE trades")
+        estimate = await get_trade_count_estimate(migrated_pool)
+        assert estimate >= 400
+
     async def test_insert_empty_list_returns_zero(
         self, migrated_pool: asyncpg.Pool
     ) -> None:
@@ -127,9 +137,8 @@ class TestGetRecentTrades:
         results = await get_recent_trades(migrated_pool, token_id, limit=5)
 
         assert len(results) == 5
-        # Most recent first (ts DESC)
-        for k in range(len(results) - 1):
-            assert results[k].ts > results[k + 1].ts
+        # Strictly ts DESC
+        assert all(a.ts > b.ts for a, b in pairwise(results))
         # The most recent trade has the highest price
         assert abs(results[0].price - (0.50 + 19 * 0.01)) < 1e-9
 
@@ -230,3 +239,31 @@ class TestDuplicateTradeId:
         # Total should still be 2 (not 4)
         total = await get_trade_count(migrated_pool)
         assert total == 2
+
+
+class TestInsertTradesStrategy:
+    """Test which insert path insert_trades takes (mock pool, no DB)."""
+
+    async def test_small_batch_uses_executemany(self) -> None:
+        """Batches below _COPY_MIN_ROWS skip COPY."""
+        pool = AsyncMock()
+        ts = datetime.now(timezone.utc)
+        trades = [make_trade_tuple("tok_small", ts=ts) for _ in range(_COPY_MIN_ROWS - 1)]
+
+        count = await insert_trades(pool, trades)
+
+        assert count == len(trades)
+        pool.executemany.assert_awaited_once()
+        pool.copy_records_to_table.assert_not_awaited()
+
+    async def test_large_batch_uses_copy(self) -> None:
+        """Batches of _COPY_MIN_ROWS or more go through COPY."""
+        pool = AsyncMock()
+        ts = datetime.now(timezone.utc)
+        trades = [make_trade_tuple("tok_large", ts=ts) for _ in range(_COPY_MIN_ROWS)]
+
+        count = await insert_trades(pool, trades)
+
+        assert count == len(trades)
+        pool.copy_records_to_table.assert_awaited_once()
+        pool.executemany.assert_not_awaited()
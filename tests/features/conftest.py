@@ -1,9 +1,10 @@
 """Shared fixtures for feature query tests.
 
-Re-exports the migrated_pool fixture from tests/db/conftest.py so that
+Re-exports the migrated_pool fixture (and the class-scoped
+_migrated_schema it depends on) from tests/db/conftest.py so that
 feature tests have the full schema available via the same pattern.
 """
 
-from tests.db.conftest import migrated_pool
+from tests.db.conftest import _migrated_schema, migrated_pool
 
-__all__ = ["migrated_pool"]
+__all__ = ["_migrated_schema", "migrated_pool"]
@@ -12,8 +12,10 @@ Test cases:
 6. get_market_features - combined features for a market's tokens
 """
 
-import json
+import asyncio
 from datetime import datetime, timedelta, timezone
+from itertools import pairwise
+from math import isclose
 
 import asyncpg
 import pytest
@@ -39,16 +41,16 @@ TOKEN_B = "token_b_0002"
 CONDITION_ID = "cond_test_0001"
 
 
-async def _insert_prices(
+async def _insert_prices_multi(
     pool: asyncpg.Pool,
-    token_id: str,
-    prices: list[float],
+    token_prices: dict[str, list[float]],
     start: datetime = BASE_TS,
     interval_minutes: int = 1,
 ) -> None:
-    """Insert synthetic price snapshots."""
+    """Insert synthetic price snapshots for several tokens in one COPY."""
     records = [
         (start + timedelta(minutes=i * interval_minutes), token_id, price, None)
+        for token_id, prices in token_prices.items()
         for i, price in enumerate(prices)
     ]
     await pool.copy_records_to_table(
@@ -58,6 +60,37 @@ async def _insert_prices(
     )
 
 
+async def _insert_prices(
+    pool: asyncpg.Pool,
+    token_id: str,
+    prices: list[float],
+    start: datetime = BASE_TS,
+    interval_minutes: int = 1,
+) -> None:
+    """Insert synthetic price snapshots."""
+    await _insert_prices_multi(pool, {token_id: prices}, start, interval_minutes)
+
+
+_ORDERBOOK_COLUMNS = ["ts", "token_id", "bids", "asks", "spread", "midpoint"]
+_TRADE_COLUMNS = ["ts", "token_id", "side", "price", "size", "trade_id"]
+
+
+async def _insert_orderbooks(
+    pool: asyncpg.Pool,
+    snapshots: list[tuple],
+) -> None:
+    """Insert synthetic orderbook snapshots in one COPY.
+
+    Each tuple is ``(ts, token_id, bids, asks, spread, midpoint)``; bids and
+    asks are encoded by the test pool's JSONB codec.
+    """
+    await pool.copy_records_to_table(
+        "orderbook_snapshots",
+        records=snapshots,
+        columns=_ORDERBOOK_COLUMNS,
+    )
+
+
 async def _insert_orderbook(
     pool: asyncpg.Pool,
     token_id: str,
@@ -68,18 +101,8 @@ async def _insert_orderbook(
     ts: datetime | None = None,
 ) -> None:
     """Insert a single synthetic orderbook snapshot."""
-    ts = ts or BASE_TS
-    await pool.execute(
-        """
-        INSERT INTO orderbook_snapshots (ts, token_id, bids, asks, spread, midpoint)
-        VALUES ($1, $2, $3::jsonb, $4::jsonb, $5, $6)
-        """,
-        ts,
-        token_id,
-        json.dumps(bids),
-        json.dumps(asks),
-        spread,
-        midpoint,
+    await _insert_orderbooks(
+        pool, [(ts or BASE_TS, token_id, bids, asks, spread, midpoint)]
     )
 
 
@@ -90,24 +113,21 @@ async def _insert_trades(
     start: datetime = BASE_TS,
 ) -> None:
     """Insert synthetic trades.  Each tuple is (side, price, size)."""
-    records = []
-    for i, (side, price, size) in enumerate(trades):
-        records.append(
-            (
-                start + timedelta(minutes=i),
-                token_id,
-                side,
-                price,
-                size,
-                f"trade_{i:04d}",
-            )
+    records = [
+        (
+            start + timedelta(minutes=i),
+            token_id,
+            side,
+            price,
+            size,
+            f"trade_{i:04d}",
         )
-    await pool.executemany(
-        """
-        INSERT INTO trades (ts, token_id, side, price, size, trade_id)
-        VALUES ($1, $2, $3, $4, $5, $6)
-        """,
-        records,
+        for i, (side, price, size) in enumerate(trades)
+    ]
+    await pool.copy_records_to_table(
+        "trades",
+        records=records,
+        columns=_TRADE_COLUMNS,
     )
 
 
@@ -160,11 +180,11 @@ class TestGetPriceReturns:
         assert len(results) == 3
         ts_vals, return_vals = zip(*results)
         # 0.50 -> 0.55: +10%
-        assert abs(return_vals[0] - 10.0) < 1e-6
+        assert isclose(return_vals[0], 10.0, abs_tol=1e-6)
         # 0.55 -> 0.60: ~+9.09%
-        assert abs(return_vals[1] - (5 / 55 * 100)) < 1e-6
+        assert isclose(return_vals[1], 5 / 55 * 100, abs_tol=1e-6)
         # 0.60 -> 0.50: ~-16.67%
-        assert abs(return_vals[2] - (-10 / 60 * 100)) < 1e-6
+        assert isclose(return_vals[2], -10 / 60 * 100, abs_tol=1e-6)
 
     async def test_empty_table_returns_empty_list(
         self, migrated_pool: asyncpg.Pool
@@ -242,41 +262,34 @@ class TestGetSpreadHistory:
         """Only snapshots within the lookback window are returned."""
         now = datetime.now(timezone.utc)
         # Insert one recent and one old snapshot
-        await _insert_orderbook(
-            migrated_pool, TOKEN_A, [], [], spread=0.02, midpoint=0.50,
-            ts=now - timedelta(hours=1),
-        )
-        await _insert_orderbook(
-            migrated_pool, TOKEN_A, [], [], spread=0.05, midpoint=0.40,
-            ts=now - timedelta(hours=48),
-        )
+        await _insert_orderbooks(migrated_pool, [
+            (now - timedelta(hours=1), TOKEN_A, [], [], 0.02, 0.50),
+            (now - timedelta(hours=48), TOKEN_A, [], [], 0.05, 0.40),
+        ])
 
         results = await get_spread_history(
             migrated_pool, TOKEN_A, lookback_hours=24
         )
         assert len(results) == 1
         ts, spread, midpoint = results[0]
-        assert abs(spread - 0.02) < 1e-9
-        assert abs(midpoint - 0.50) < 1e-9
+        assert isclose(spread, 0.02, abs_tol=1e-9)
+        assert isclose(midpoint, 0.50, abs_tol=1e-9)
 
     async def test_ordered_ascending(
         self, migrated_pool: asyncpg.Pool
     ) -> None:
         """Results are ordered oldest-first."""
         now = datetime.now(timezone.utc)
-        for i in range(3):
-            await _insert_orderbook(
-                migrated_pool, TOKEN_A, [], [],
-                spread=float(i) * 0.01,
-                ts=now - timedelta(hours=3 - i),
-            )
+        await _insert_orderbooks(migrated_pool, [
+            (now - timedelta(hours=3 - i), TOKEN_A, [], [], float(i) * 0.01, None)
+            for i in range(3)
+        ])
 
         results = await get_spread_history(
             migrated_pool, TOKEN_A, lookback_hours=24
         )
         assert len(results) == 3
-        timestamps = [r[0] for r in results]
-        assert timestamps == sorted(timestamps)
+        assert all(a[0] <= b[0] for a, b in pairwise(results))
 
     async def test_empty_returns_empty_list(
         self, migrated_pool: asyncpg.Pool
@@ -296,32 +309,29 @@ class TestGetSpreadHistory:
 class TestGetOrderbookImbalance:
     """Test order-book imbalance from latest snapshot."""
 
-    async def test_bid_heavy_positive_imbalance(
-        self, migrated_pool: asyncpg.Pool
-    ) -> None:
-        """More bid volume than ask volume produces positive imbalance."""
-        bids = [[0.49, 100.0], [0.48, 200.0]]  # bid_vol = 300
-        asks = [[0.51, 50.0]]                   # ask_vol = 50
-        await _insert_orderbook(migrated_pool, TOKEN_A, bids, asks)
-
-        imb = await get_orderbook_imbalance(migrated_pool, TOKEN_A)
-        assert imb is not None
-        # (300 - 50) / (300 + 50) = 250/350 ≈ 0.714
-        expected = (300 - 50) / (300 + 50)
-        assert abs(imb - expected) < 1e-6
-
-    async def test_ask_heavy_negative_imbalance(
-        self, migrated_pool: asyncpg.Pool
+    @pytest.mark.parametrize(
+        ("bids", "asks"),
+        [
+            # bid_vol = 300, ask_vol = 50 -> (300 - 50) / 350 ≈ 0.714
+            pytest.param(
+                [[0.49, 100.0], [0.48, 200.0]], [[0.51, 50.0]], id="bid_heavy"
+            ),
+            # bid_vol = 10, ask_vol = 90 -> (10 - 90) / 100 = -0.8
+            pytest.param([[0.49, 10.0]], [[0.51, 90.0]], id="ask_heavy"),
+        ],
+    )
+    async def test_imbalance_sign_and_magnitude(
+        self, migrated_pool: asyncpg.Pool, bids: list, asks: list
     ) -> None:
-        """More ask volume than bid volume produces negative imbalance."""
-        bids = [[0.49, 10.0]]
-        asks = [[0.51, 90.0]]
+        """Imbalance is (bid_vol - ask_vol) / (bid_vol + ask_vol)."""
         await _insert_orderbook(migrated_pool, TOKEN_A, bids, asks)
 
         imb = await get_orderbook_imbalance(migrated_pool, TOKEN_A)
         assert imb is not None
-        expected = (10 - 90) / (10 + 90)
-        assert abs(imb - expected) < 1e-6
+        bid_vol = sum(size for _, size in bids)
+        ask_vol = sum(size for _, size in asks)
+        expected = (bid_vol - ask_vol) / (bid_vol + ask_vol)
+        assert isclose(imb, expected, abs_tol=1e-6)
 
     async def test_no_data_returns_none(
         self, migrated_pool: asyncpg.Pool
@@ -363,8 +373,8 @@ class TestGetTradeVolumeProfile:
             migrated_pool, TOKEN_A, lookback_hours=24
         )
 
-        assert abs(profile["buy_volume"] - 150.0) < 1e-6
-        assert abs(profile["sell_volume"] - 100.0) < 1e-6
+        assert isclose(profile["buy_volume"], 150.0, abs_tol=1e-6)
+        assert isclose(profile["sell_volume"], 100.0, abs_tol=1e-6)
         assert profile["trade_count"] == 4
 
     async def test_no_data_returns_zeros(
@@ -383,16 +393,21 @@ class TestGetTradeVolumeProfile:
     ) -> None:
         """Trades outside the lookback window are excluded."""
         recent_trades = [("BUY", 0.50, 10.0)]
-        old_start = datetime.now(timezone.utc) - timedelta(hours=48)
-        recent_start = datetime.now(timezone.utc) - timedelta(hours=1)
-
-        await _insert_trades(migrated_pool, TOKEN_A, [("SELL", 0.49, 999.0)], start=old_start)
-        await _insert_trades(migrated_pool, TOKEN_A, recent_trades, start=recent_start)
+        now = datetime.now(timezone.utc)
+        old_start = now - timedelta(hours=48)
+        recent_start = now - timedelta(hours=1)
+
+        await asyncio.gather(
+            _insert_trades(
+                migrated_pool, TOKEN_A, [("SELL", 0.49, 999.0)], start=old_start
+            ),
+            _insert_trades(migrated_pool, TOKEN_A, recent_trades, start=recent_start),
+        )
 
         profile = await get_trade_volume_profile(
             migrated_pool, TOKEN_A, lookback_hours=24
         )
-        assert abs(profile["buy_volume"] - 10.0) < 1e-6
+        assert isclose(profile["buy_volume"], 10.0, abs_tol=1e-6)
         assert profile["sell_volume"] == 0.0
         assert profile["trade_count"] == 1
 
@@ -402,19 +417,32 @@ class TestGetTradeVolumeProfile:
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="class")
+async def seeded_market_pool(_migrated_schema: asyncpg.Pool) -> asyncpg.Pool:
+    """Return the class's freshly migrated pool with one two-token market.
+
+    Seeded once per class.  Tests using it must not also request
+    ``migrated_pool``, whose per-test TRUNCATE would wipe the seed rows.
+    """
+    # Independent rows: insert them concurrently on separate connections
+    await asyncio.gather(
+        _insert_market(_migrated_schema, CONDITION_ID, [TOKEN_A, TOKEN_B]),
+        _insert_prices_multi(_migrated_schema, {
+            TOKEN_A: [0.60, 0.62, 0.61],
+            TOKEN_B: [0.38, 0.36, 0.37],
+        }),
+    )
+    return _migrated_schema
+
+
 class TestGetMarketFeatures:
-    """Test combined feature aggregation per market."""
+    """Test combined feature aggregation per market (read-only, shared seed)."""
 
     async def test_returns_features_for_each_token(
-        self, migrated_pool: asyncpg.Pool
+        self, seeded_market_pool: asyncpg.Pool
     ) -> None:
         """Feature dict contains an entry for every clob_token_id in the market."""
-        await _insert_market(migrated_pool, CONDITION_ID, [TOKEN_A, TOKEN_B])
-
-        await _insert_prices(migrated_pool, TOKEN_A, [0.60, 0.62, 0.61])
-        await _insert_prices(migrated_pool, TOKEN_B, [0.38, 0.36, 0.37])
-
-        features = await get_market_features(migrated_pool, CONDITION_ID)
+        features = await get_market_features(seeded_market_pool, CONDITION_ID)
 
         assert TOKEN_A in features
         assert TOKEN_B in features
@@ -427,8 +455,8 @@ class TestGetMarketFeatures:
             assert "volume_profile" in f
 
     async def test_unknown_condition_id_returns_empty(
-        self, migrated_pool: asyncpg.Pool
+        self, seeded_market_pool: asyncpg.Pool
     ) -> None:
         """A condition_id not in the DB returns empty dict."""
-        features = await get_market_features(migrated_pool, "nonexistent_cond")
+        features = await get_market_features(seeded_market_pool, "nonexistent_cond")
         assert features == {}